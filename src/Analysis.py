@@ -1,7 +1,7 @@
 """Record the best individuals and fitness score statistics for each generation of Phenotypes."""
-from pathlib import Path
+import csv
 
-import pandas as pd
+import numpy as np
 from src.Phenotype import Phenotype
 
 
@@ -12,67 +12,131 @@ class Analysis:
         """Track the population as it is updated."""
         self.population = population
         self.generation_counter = 0
+        # CSV handles and writers, opened lazily on the first write and kept
+        # open so each generation's log lines are single cheap appends.
+        self._fit_file = None
+        self._fit_writer = None
+        self._fit_path = None
+        self._fit_header_written = False
+        self._best_file = None
+        self._best_writer = None
+        self._best_path = None
+        self._best_header_written = False
 
     def update(self, generation_num: int) -> None:
         """Increment the generation counter; write to the fitness and the best individual CSV files."""
         self.generation_counter = generation_num
         print(f"Generation: {self.generation_counter}")
-        self.update_fitness()
-        self.update_best_individual()
+        # Snapshot the population once and feed both statistics from it,
+        # instead of each updater traversing the object graph on its own.
+        ranks, scores = self._snapshot()
+        self.update_fitness(scores=scores)
+        self.update_best_individual(ranks=ranks)
 
-    def update_best_individual(self) -> list[Phenotype]:
+    def _snapshot(self) -> tuple:
+        """Collect every individual's rank and fitness scores in one population pass."""
+        metrics = list(self.population[0].fitness_score)
+        ranks = np.empty(len(self.population))
+        scores = np.empty((len(self.population), len(metrics)))
+        for i, indv in enumerate(self.population):
+            ranks[i] = indv.nsgaii_rank
+            scores[i] = [indv.fitness_score[metric] for metric in metrics]
+        return ranks, scores
+
+    def update_best_individual(self, ranks: np.ndarray = None) -> list[Phenotype]:
         """Read the nsgaii rank from each individual and find the individuals on the pareto front (lowest rank)."""
-        min_rank = min(indv.nsgaii_rank for indv in self.population)
-        best_indvs = [indv for indv in self.population if indv.nsgaii_rank==min_rank]
+        if ranks is None:
+            ranks = np.array([indv.nsgaii_rank for indv in self.population])
+        best_indvs = [self.population[i] for i in np.flatnonzero(ranks == ranks.min())]
         self.to_csv_best_individual(best_indvs)
         return best_indvs
 
     def to_csv_best_individual(self,
                                best_indvs: list[Phenotype],
                                csv_path: str="best_individuals.csv",
-    ) -> None:
-        """Write the attributes of the best phenotypes to a CSV file."""
+    ) -> list:
+        """Append the attributes of the best phenotypes to a CSV file."""
 
-        def make_row(indv: Phenotype) -> pd.DataFrame:
+        def make_row(indv: Phenotype) -> dict:
             """Get the attributes of a phenotype and turn its attributes into a table row."""
             row = {}
-            row["ID"]                   = [indv.indv_id]
-            row["Parent_ID"]            = [indv.parent_id]
-            row["Generation_Created"]   = [indv.generation_created]
-            row["Height"]               = [indv.genotype.height]
-            row["Waveguide_Height"]     = [indv.genotype.waveguide_height]
-            row["Waveguide_Length"]     = [indv.genotype.waveguide_length]
-            for metric, score in indv.fitness_score.items():
-                row[metric] = [score]
-            return pd.DataFrame(row)
-        indv_df = pd.concat([make_row(indv) for indv in best_indvs])
-        indv_df.to_csv(csv_path, mode="w", header=True, index=False)
-        return indv_df
+            row["ID"]                   = indv.indv_id
+            row["Parent_ID"]            = indv.parent_id
+            row["Generation_Created"]   = indv.generation_created
+            row["Height"]               = indv.genotype.height
+            row["Waveguide_Height"]     = indv.genotype.waveguide_height
+            row["Waveguide_Length"]     = indv.genotype.waveguide_length
+            row.update(indv.fitness_score)
+            return row
+        rows = [make_row(indv) for indv in best_indvs]
+        if self._best_writer is None or csv_path != self._best_path:
+            if self._best_file is not None:
+                self._best_file.close()
+            # Append mode so a restarted run extends the existing log; only
+            # a fresh (empty) file gets a header.
+            # The handle outlives this call on purpose; close() owns it
+            self._best_file = open(csv_path, "a", newline="")  # noqa: SIM115
+            self._best_writer = csv.writer(self._best_file)
+            self._best_path = csv_path
+            self._best_header_written = self._best_file.tell() > 0
+        if not self._best_header_written:
+            self._best_writer.writerow(rows[0].keys())
+            self._best_header_written = True
+        self._best_writer.writerows([row.values() for row in rows])
+        self._best_file.flush()
+        return rows
 
-    def update_fitness(self) -> None:
+    def update_fitness(self, scores: np.ndarray = None) -> None:
         """Read the fitness from each individual and calculate the maximum and average."""
-        # Create dictionary containing fitness scores from every phenotype in the population.
-        all_scores = {}
-        for indv in self.population:
-            scores = indv.fitness_score
-            # Append the fitness scores for each individual to the all_score dictionary.
-            if len(all_scores) > 0:
-                for metric, score in scores.items():
-                    all_scores[metric].append(score)
-            # On the first phenotype of the population, initiate the all_score dictionary.
-            else:
-                all_scores = {metric: [score] for metric, score in scores.items()}
+        # Stack every phenotype's fitness scores into an (N, M) matrix so the
+        # averages and maxima reduce in one NumPy pass per statistic.
+        metrics = list(self.population[0].fitness_score)
+        if scores is None:
+            scores = np.array([[indv.fitness_score[metric] for metric in metrics] for indv in self.population], dtype=np.float64)
+        averages = scores.mean(axis=0)
+        maximums = scores.max(axis=0)
         # Create the fitness statistics log.
         fitness = {"Generation": self.generation_counter}
-        for metric, scores in all_scores.items():
-            fitness[metric+"_Average"] = [sum(scores) / len(scores)]
-            fitness[metric+"_Maximum"] = [max(scores)]
+        for metric, avg, high in zip(metrics, averages, maximums, strict=True):
+            fitness[metric+"_Average"] = [avg]
+            fitness[metric+"_Maximum"] = [high]
         self.to_csv_fitness(fitness)
         return fitness
 
-    def to_csv_fitness(self, fitness: dict, csv_path: str="fitness.csv") -> pd.DataFrame:
-        """Write generation fitness statistics to a CSV file."""
-        # Format data for CSV using pandas.
-        fitness_row = pd.DataFrame(fitness)
-        fitness_row.to_csv(csv_path, mode="a", header=not Path(csv_path).exists(), index=False)
-        return fitness_row
+    def to_csv_fitness(self, fitness: dict, csv_path: str="fitness.csv") -> dict:
+        """Append generation fitness statistics to a CSV file."""
+        # Unwrap the one-element list values so each statistic is a scalar.
+        row = {stat: value[0] if isinstance(value, list) else value for stat, value in fitness.items()}
+        if self._fit_writer is None or csv_path != self._fit_path:
+            if self._fit_file is not None:
+                self._fit_file.close()
+            # Append mode so a restarted run extends the existing log; only
+            # a fresh (empty) file gets a header.
+            # The handle outlives this call on purpose; close() owns it
+            self._fit_file = open(csv_path, "a", newline="")  # noqa: SIM115
+            self._fit_writer = csv.writer(self._fit_file)
+            self._fit_path = csv_path
+            self._fit_header_written = self._fit_file.tell() > 0
+        if not self._fit_header_written:
+            self._fit_writer.writerow(row.keys())
+            self._fit_header_written = True
+        self._fit_writer.writerow(row.values())
+        self._fit_file.flush()
+        return row
+
+    def close(self) -> None:
+        """Close the CSV files if they were opened."""
+        if self._fit_file is not None:
+            self._fit_file.close()
+            self._fit_file = None
+            self._fit_writer = None
+            self._fit_path = None
+        if self._best_file is not None:
+            self._best_file.close()
+            self._best_file = None
+            self._best_writer = None
+            self._best_path = None
+
+    def __del__(self) -> None:
+        """Make sure the CSV files are closed when the analysis is dropped."""
+        self.close()
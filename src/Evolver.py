@@ -3,6 +3,8 @@
 import random
 from abc import ABC, abstractmethod
 
+import numpy as np
+from src import _nsga_kernels
 from src.Phenotype import Phenotype
 from src.Selectors import NSGATournament
 
@@ -30,32 +32,67 @@ class NSGA2(AbstractEvolver):
         """
         pop_size = len(population)
 
-        # Assign ranks and distances
-        fronts = fast_non_dominated_sort(population)
-        for front in fronts:
-            crowding_distance_assignment(front)
-
-        # Generate offspring
-        offspring = []
+        # Assign ranks and distances, keeping the parents' fitness matrix and
+        # dominance block so the combined sort below can reuse them.
+        F_parents = np.stack([fitness_vector(indiv) for indiv in population])
+        dom_parents = _nsga_kernels.dominance_matrix(F_parents)
+        _rank_and_distance(population, F=F_parents, dom=dom_parents)
+
+        # Select parents serially so the tournament draws stay deterministic,
+        # then clone and mutate the whole brood in one batched pass: per-child
+        # mutation is a few array ops, so one vectorized sweep beats both a
+        # per-child Python loop and the pickling cost of a process pool. The
+        # batch RNG is seeded once from the parent RNG to stay reproducible.
+        # Bind the tournament to a local once: the bound method skips an
+        # attribute resolution per draw (and fixes the previous unbound
+        # class-level call).
+        select_one = NSGATournament().select_one
+        parents = []
+        new_ids = []
         for i in range(pop_size):
-            parent1 = NSGATournament.select_one(population, rand)
+            parent1 = select_one(population, rand)
             # uncomment these lines for crossover
-            #parent2 = NSGATournament.select_one(population, rand)
-            new_child_id = generation_num*pop_size + i
-            #child = parent1.make_offspring(new_child_id, parent2)
-            child = parent1.make_offspring(new_child_id, rand)
-            child.generation_created = generation_num
+            #parent2 = select_one(population, rand)
+            parents.append(parent1)
+            new_ids.append(generation_num*pop_size + i)
 
-            offspring.append(child)
+        child_rng = np.random.default_rng(rand.getrandbits(63))
+        offspring = Phenotype.make_offspring_batch(parents, new_ids,
+                                                   generation_num, child_rng)
 
         # Combine parents + offspring
         combined = population + offspring
 
-        # Re-sort and truncate to pop_size for elitism
-        fronts = fast_non_dominated_sort(combined)
+        # Re-sort and truncate to pop_size for elitism. The parent-vs-parent
+        # dominance block is already known from the first sort, so only the
+        # blocks involving offspring are computed fresh.
+        F_offspring = np.stack([fitness_vector(indiv) for indiv in offspring])
+        dom = np.block([
+            [dom_parents, _nsga_kernels.dominance_cross(F_parents, F_offspring)],
+            [_nsga_kernels.dominance_cross(F_offspring, F_parents),
+             _nsga_kernels.dominance_matrix(F_offspring)],
+        ])
+        # Consume fronts lazily and stop as soon as pop_size individuals are
+        # covered, so the deep tail fronts of the combined population are
+        # never extracted at all.
+        F_combined = np.vstack([F_parents, F_offspring])
+        selected_fronts = []
+        selected_count = 0
+        for rank, front_idx in enumerate(_nsga_kernels.iter_fronts_from_dominance(dom)):
+            for i in front_idx:
+                combined[i].nsgaii_rank = rank
+            selected_fronts.append(front_idx)
+            selected_count += len(front_idx)
+            if selected_count >= pop_size:
+                break
+
+        # Crowding is only needed on the fronts that made the cut
+        distances = _nsga_kernels.crowding_distances_by_front(F_combined, selected_fronts)
         new_pop = []
-        for front in fronts:
-            crowding_distance_assignment(front)
+        for front_idx in selected_fronts:
+            for i in front_idx:
+                combined[i].nsgaii_distance = distances[i]
+            front = [combined[i] for i in front_idx]
             if len(new_pop) + len(front) <= pop_size:
                 new_pop.extend(front)
             else:
@@ -65,45 +102,63 @@ class NSGA2(AbstractEvolver):
 
         return (new_pop)
 
+def _rank_and_distance(population: list, F: np.ndarray = None, dom: np.ndarray = None) -> list[list]:
+    """
+    Assign NSGA-II ranks and crowding distances to a whole population in one pass.
+
+    Builds the fitness matrix once and shares it between the non-dominated
+    sort and the all-fronts crowding computation, which reuses a single
+    global per-objective sort instead of re-sorting each front. Callers that
+    already hold the population's fitness matrix and/or dominance matrix can
+    pass them in to skip recomputation.
+    """
+    if F is None:
+        F = np.stack([fitness_vector(indiv) for indiv in population])
+    if dom is None:
+        dom = _nsga_kernels.dominance_matrix(F)
+    front_indices = _nsga_kernels.fronts_from_dominance(dom)
+    distances = _nsga_kernels.crowding_distances_by_front(F, front_indices)
+
+    for rank, front_idx in enumerate(front_indices):
+        for i in front_idx:
+            population[i].nsgaii_rank = rank
+    for indiv, dist in zip(population, distances, strict=True):
+        indiv.nsgaii_distance = dist
+    return [[population[i] for i in front_idx] for front_idx in front_indices]
+
 ### Helper functions for NSGAII
+def fitness_vector(indiv: Phenotype) -> np.ndarray:
+    """
+    Return the individual's fitness values as a float64 array, cached on the individual.
+
+    The cache avoids re-reading the fitness dict on every dominance
+    comparison. It is computed lazily on first use and invalidated by the
+    Phenotype.fitness setter, so reassigning an individual's fitness never
+    leaves a stale vector behind.
+    """
+    fvec = getattr(indiv, "fvec", None)
+    if fvec is None:
+        fvec = np.fromiter(indiv.fitness.values(), dtype=np.float64, count=len(indiv.fitness))
+        indiv.fvec = fvec
+    return fvec
+
 def fast_non_dominated_sort(population: list) -> list[list]:
     """Assigns NSGA-II Pareto rank to each individual in the population. Lower rank = better front."""
-    fronts: list[list] = [[]]
-
-    # For every individual get who it dominates, and how many it is dominated by
-    for indiv in population:
-        indiv.dominated_set = []
-        indiv.domination_count = 0
-
-        for q in population:
-            if indiv is q:
-                continue
-
-            if dominates(indiv, q):
-                indiv.dominated_set.append(q)
-            elif dominates(q, indiv):
-                indiv.domination_count += 1
-
-        # If you're not dominated by anyone, you go in the first front
-        if indiv.domination_count == 0:
-            indiv.nsgaii_rank = 0
-            fronts[0].append(indiv)
-
-    i = 0
-    while fronts[i]:
-        next_front = []
-        # For each individual in the current front
-        for indiv in fronts[i]:
-            # If this individual dominates a solution, reduce that solution's domination count by one
-            for q in indiv.dominated_set:
-                q.domination_count -= 1
-                # If the solution has nobody left dominating it, it belongs in the next front
-                if q.domination_count == 0:
-                    q.nsgaii_rank = i + 1
-                    next_front.append(q)
-        i += 1
-        fronts.append(next_front)
-    return fronts[:-1]
+    if len(population) == 0:
+        return []
+
+    # Stack every individual's fitness values into an (N, M) matrix so the
+    # N^2 pairwise dominance checks happen as broadcasted array comparisons
+    # instead of Python-level loops over the population.
+    F = np.stack([fitness_vector(indiv) for indiv in population])
+    dom = _nsga_kernels.dominance_matrix(F)
+
+    fronts: list[list] = []
+    for rank, front_idx in enumerate(_nsga_kernels.fronts_from_dominance(dom)):
+        for i in front_idx:
+            population[i].nsgaii_rank = rank
+        fronts.append([population[i] for i in front_idx])
+    return fronts
 
 def dominates(p: Phenotype, q: Phenotype) -> bool:
     """
@@ -114,9 +169,9 @@ def dominates(p: Phenotype, q: Phenotype) -> bool:
     q (Phenotype): Second individual to compare
 
     """
-    p_better_or_equal = all(p.fitness[obj] <= q.fitness[obj] for obj in p.fitness)
-    p_strictly_better = any(p.fitness[obj] < q.fitness[obj] for obj in p.fitness)
-    return p_better_or_equal and p_strictly_better
+    p_fvec = fitness_vector(p)
+    q_fvec = fitness_vector(q)
+    return bool((p_fvec <= q_fvec).all() and (p_fvec < q_fvec).any())
 
 def crowding_distance_assignment(front: list) -> None:
     """
@@ -126,39 +181,11 @@ def crowding_distance_assignment(front: list) -> None:
     """
     if len(front) == 0:
         return
-    if len(front) == 1:
-        front[0].nsgaii_distance = float("inf")
-        return
-    num_for_double_front = 2
-    if len(front) == num_for_double_front:
-        front[0].nsgaii_distance = float("inf")
-        front[1].nsgaii_distance = float("inf")
-        return
 
-    for indiv in front:
-        indiv.nsgaii_distance = 0.0
-
-    # For every objective
-    for obj in front[0].fitness:
-        # Sort the front for this objective
-        front.sort(key=lambda indiv: indiv.fitness[obj])
-        # Get the max and min for normalization
-        f_min = front[0].fitness[obj]
-        f_max = front[-1].fitness[obj]
-
-        # If equal we will get division by zero, so skip
-        if f_max == f_min:
-            continue
-
-        # Boundary points get infinite distance
-        front[0].nsgaii_distance = float("inf")
-        front[-1].nsgaii_distance = float("inf")
-
-        # For every point in the front
-        for i in range(1, len(front) - 1):
-            if front[i].nsgaii_distance != float("inf"):
-                # Get the two closest points
-                prev_f = front[i - 1].fitness[obj]
-                next_f = front[i + 1].fitness[obj]
-                # Assign normalized crowding distance
-                front[i].nsgaii_distance += (next_f - prev_f) / (f_max - f_min)
+    # Stack the front's fitness values into an (L, M) matrix so each
+    # objective is handled with one argsort and one broadcasted difference.
+    F = np.stack([fitness_vector(indiv) for indiv in front])
+    distances = _nsga_kernels.crowding_distances(F)
+
+    for indiv, dist in zip(front, distances, strict=True):
+        indiv.nsgaii_distance = dist
@@ -8,6 +8,7 @@ This module provides:
 import random
 from typing import Optional
 
+import numpy as np
 from src.Parameters import ParametersObject
 from src.WallPair import WallPair
 
@@ -29,8 +30,11 @@ class Genotype:
     :type walls: list, optional
     """
 
-    # TODO constants should all be read in fron config instead of hardcoded
-    #  here
+    # Default gene bounds; ParametersObject overwrites these on the class
+    # with the config's values at load, so the config stays canonical.
+
+    MIN_HEIGHT = 2.0                # lambda; inclusive
+    MAX_HEIGHT = 5.0                # lambda; inclusive
 
     MIN_WAVEGUIDE_HEIGHT = 200.0    # cm; inclusive -- func of min freq you
     # care about picking up
@@ -40,6 +44,34 @@ class Genotype:
     MIN_WAVEGUIDE_LENGTH = 100.0    # cm; inclusive
     MAX_WAVEGUIDE_LENGTH = 1000.0   # cm; inclusive
 
+    # Data-driven gene dispatch: (attribute, lower-bound attribute,
+    # upper-bound attribute) per core gene. Mutation batches its array math
+    # over these tables instead of naming each gene in code.
+    CORE_GENES = (
+        ("height", "MIN_HEIGHT", "MAX_HEIGHT"),
+        ("waveguide_height", "MIN_WAVEGUIDE_HEIGHT", "MAX_WAVEGUIDE_HEIGHT"),
+        ("waveguide_length", "MIN_WAVEGUIDE_LENGTH", "MAX_WAVEGUIDE_LENGTH"),
+    )
+    _WALL_GENES = (
+        ("angle", "MIN_ANGLE", "MAX_ANGLE"),
+        ("ridge_height", "MIN_RIDGE_HEIGHT", "MAX_RIDGE_HEIGHT"),
+        ("ridge_width_top", "MIN_RIDGE_WIDTH_TOP", "MAX_RIDGE_WIDTH_TOP"),
+        ("ridge_width_bottom", "MIN_RIDGE_WIDTH_BOTTOM", "MAX_RIDGE_WIDTH_BOTTOM"),
+        ("ridge_thickness_top", "MIN_RIDGE_THICKNESS_TOP", "MAX_RIDGE_THICKNESS_TOP"),
+        ("ridge_thickness_bottom", "MIN_RIDGE_THICKNESS_BOTTOM", "MAX_RIDGE_THICKNESS_BOTTOM"),
+    )
+
+    # Fixed slot layout: one Genotype is allocated per individual per
+    # generation, so dropping the per-instance __dict__ is worth it. The
+    # gene bounds resolve through the class attributes above.
+    __slots__ = (
+        "cfg",
+        "height",
+        "walls",
+        "waveguide_height",
+        "waveguide_length",
+    )
+
     def __init__(self, cfg: ParametersObject,
                  height: Optional[float] = None,
                  waveguide_height: Optional[float] = None,
@@ -64,22 +96,17 @@ class Genotype:
         """
         self.cfg = cfg
 
-        # Logical constraint constants
-        self.MAX_HEIGHT = cfg.MAX_HEIGHT
-        self.MIN_HEIGHT = cfg.MIN_HEIGHT
-
-        # cm; inclusive
-        self.MIN_WAVEGUIDE_LENGTH = cfg.MIN_WAVEGUIDE_LENGTH
-        self.MAX_WAVEGUIDE_LENGTH = cfg.MAX_WAVEGUIDE_LENGTH
-
-        self.MIN_WAVEGUIDE_HEIGHT = cfg.MIN_WAVEGUIDE_HEIGHT # cm; inclusive -- func of min freq you
-    # care about picking up
-        self.MAX_WAVEGUIDE_HEIGHT = cfg.MAX_WAVEGUIDE_HEIGHT # cm; inclusive; # TODO also prevent being
-    # bigger than aperture (in line check somewhere, not here)
-
-        # Make sure the list of walls provided to the constructor is valid.
-        if walls is not None and not all(isinstance(wall_pair, WallPair) for wall_pair in walls):
-            raise ValueError("walls must be a list of WallPair objects.")
+        # Make sure the walls provided to the constructor are valid. A packed
+        # (W, k) gene array validates with one constant-time shape check; the
+        # object-list form still needs the per-element isinstance pass.
+        if walls is not None:
+            if isinstance(walls, np.ndarray):
+                # the 2 is the array's dimensionality, not a tunable
+                if walls.ndim != 2 or walls.shape[1] != len(WallPair.PARAM_NAMES):  # noqa: PLR2004
+                    raise ValueError("walls array must have shape (num_wall_pairs, "
+                                     f"{len(WallPair.PARAM_NAMES)}).")
+            elif not all(isinstance(wall_pair, WallPair) for wall_pair in walls):
+                raise ValueError("walls must be a list of WallPair objects.")
 
         self.height = height
         self.waveguide_height = waveguide_height
@@ -90,12 +117,15 @@ class Genotype:
         """
         Generate Genotype.
 
-        Makes a Genotype object with randomly generated genes.
+        Makes a Genotype object with randomly generated genes. The scalar
+        uniform API is shared by random.Random and numpy.random.Generator,
+        so either works here; new code should pass a Generator (the
+        project's primary RNG) and batch paths should prefer generate_batch.
 
         :param num_wall_pairs: number of WallPair objects
         :param num_wall_pairs: int
         :param rand: Random number generator object.
-        :type rand: random.Random
+        :type rand: random.Random | np.random.Generator
         :return: Genotype object
         :rtype: Genotype
         """
@@ -115,52 +145,119 @@ class Genotype:
 
         return Genotype(self.cfg, height, waveguide_height, waveguide_length, walls)
 
+    def canonical_tuple(self) -> tuple:
+        """
+        Return the functionally expressed genes as a hashable tuple.
+
+        Two Genotypes with equal canonical tuples describe the same antenna:
+        each wall's ridge genes are masked to zero when its ridge is not
+        expressed, so mutations to unexpressed ridge genes do not change
+        the tuple. Used as the key of the functional-equivalence fitness
+        cache.
+
+        :return: A nested tuple of the expressed gene values.
+        :rtype: tuple
+        """
+        walls = self.walls
+        wall_genes = (() if walls is None
+                      else tuple(wp.canonical_tuple() for wp in walls))
+        return (self.height, self.waveguide_height, self.waveguide_length,
+                wall_genes)
+
+    def clone(self) -> object:
+        """
+        Copy this Genotype with direct attribute stores.
+
+        Copies the scalar genes by assignment and the walls in one pass:
+        an ndarray wall matrix duplicates with a single contiguous
+        array.copy (one memcpy for the whole wall block), a WallPair list
+        with one __copy__ per pair. cfg is shared, not copied, since it is
+        immutable for the lifetime of a run. Much cheaper than deepcopy's
+        reflective graph walk on the reproduction hot path.
+
+        :return: A new Genotype with the same gene values.
+        :rtype: Genotype
+        """
+        cls = type(self)
+        new = cls.__new__(cls)
+        new.cfg = self.cfg
+        new.height = self.height
+        new.waveguide_height = self.waveguide_height
+        new.waveguide_length = self.waveguide_length
+        walls = self.walls
+        if walls is None:
+            new.walls = None
+        elif isinstance(walls, np.ndarray):
+            new.walls = walls.copy()
+        else:
+            new.walls = [wp.__copy__() for wp in walls]
+        return new
+
+    @classmethod
+    def generate_batch(cls, cfg: ParametersObject, n: int, num_wall_pairs: int,
+                       rng: np.random.Generator) -> list:
+        """
+        Generate a batch of Genotypes with one bulk draw per core gene.
+
+        Draws all n values of each core gene in a single compiled call
+        instead of n scalar draws, then materializes Genotype objects from
+        the array slices. The gene bounds are all min-inclusive, so the
+        half-open [min, max) draws need no resampling.
+
+        :param cfg: Configuration parameters object.
+        :type cfg: ParametersObject
+        :param n: Number of Genotypes to generate.
+        :type n: int
+        :param num_wall_pairs: number of WallPair objects per Genotype.
+        :type num_wall_pairs: int
+        :param rng: Random number generator object.
+        :type rng: np.random.Generator
+        :return: A list of n randomly generated Genotype objects.
+        :rtype: list
+        """
+        heights = rng.uniform(cfg.MIN_HEIGHT, cfg.MAX_HEIGHT, n)
+        waveguide_heights = rng.uniform(cfg.MIN_WAVEGUIDE_HEIGHT,
+                                        cfg.MAX_WAVEGUIDE_HEIGHT, n)
+        waveguide_lengths = rng.uniform(cfg.MIN_WAVEGUIDE_LENGTH,
+                                        cfg.MAX_WAVEGUIDE_LENGTH, n)
+
+        return [
+            cls(cfg, height, waveguide_height, waveguide_length,
+                WallPair().generate_list(num_wall_pairs, rng))
+            for height, waveguide_height, waveguide_length
+            in zip(heights.tolist(), waveguide_heights.tolist(),
+                   waveguide_lengths.tolist(), strict=True)
+        ]
+
     def mutate(self, rand: random.Random) -> None:
         """
         Mutate Genotype.
 
         Mutates a genotype.
 
-        :param rand: Random number generator object.
-        :type rand: random.Random
+        :param rand: Random number generator object. Either a random.Random
+        or a numpy.random.Generator; the two draw different value streams, so
+        a run must seed one kind and stick with it.
+        :type rand: random.Random | np.random.Generator
         :rtype: None
         """
         per_site_mut_rate = self.cfg.per_site_mut_rate
         mut_effect_size = self.cfg.mut_effect_size
 
-        core_genes = ["height", "waveguide_height", "waveguide_length"]
-
-        # Iterate over each gene in the Genotype
-        for gene in core_genes:
-            # if it's randomly selected to mutate, apply a mutation of
-            # mut_effect_size in Guassian distribution
-            if per_site_mut_rate >= rand.uniform(0, 1):
-                # height gene
-                if gene == "height":
-                    self.height = self.height + rand.gauss(0,mut_effect_size)
-                    # if under min bound, set to min
-                    self.height = max(self.height, self.MIN_HEIGHT)
-                    # if over max bound, set to max
-                    self.height = min(self.height, self.MAX_HEIGHT)
-
-                # waveguide_height gene
-                elif gene == "waveguide_height":
-                    self.waveguide_height = (self.waveguide_height +
-                                             rand.gauss(0, mut_effect_size))
-                    # if under min bound, set to min
-                    self.waveguide_height = max(self.waveguide_height,
-                                                self.MIN_WAVEGUIDE_HEIGHT)
-                    # if over max bound, set to max
-                    self.waveguide_height = min(self.waveguide_height, self.MAX_WAVEGUIDE_HEIGHT)
-
-                # waveguide_length gene
-                elif gene == "waveguide_length":
-                    self.waveguide_length = (self.waveguide_length +
-                                                rand.gauss(0, mut_effect_size))
-                    # if under min bound, set to min
-                    self.waveguide_length = max(self.waveguide_length, self.MIN_WAVEGUIDE_LENGTH)
-                    # if over of max bound, set to max
-                    self.waveguide_length = min(self.waveguide_length, self.MAX_WAVEGUIDE_LENGTH)
+        # Pre-draw all of the mutation's randomness for the core genes in one
+        # batch, then apply it as a single masked add plus clip instead of a
+        # per-gene branch ladder.
+        u, g = _draw_mutation_batch(rand, len(self.CORE_GENES), mut_effect_size)
+
+        genes = np.array([getattr(self, name) for name, _, _ in self.CORE_GENES])
+        lows = np.array([getattr(self, lo) for _, lo, _ in self.CORE_GENES])
+        highs = np.array([getattr(self, hi) for _, _, hi in self.CORE_GENES])
+
+        genes = _mutate_array(genes, lows, highs, per_site_mut_rate, u, g)
+        for (name, _, _), value in zip(self.CORE_GENES, genes.tolist(),
+                                       strict=True):
+            setattr(self, name, value)
+
         # mutate the Genotype's walls
         self._mutate_walls(self.walls, per_site_mut_rate,
                                mut_effect_size, rand)
@@ -181,85 +278,104 @@ class Genotype:
         :param mut_effect_size: The mutation amplitude when a mutation takes place.
         :type mut_effect_size: float
         :param rand: Random number generator object.
-        :type rand: random.Random
+        :type rand: random.Random | np.random.Generator
         :rtype: None
         """
-        wallpair_genes = ["angle", "ridge_height", "ridge_width_top",
-                          "ridge_width_bottom", "ridge_thickness_top",
-                          "ridge_thickness_bottom"]
-        # Iterate over each WallPair object in the walls list
-        for wp in walls:
-            # Iterate over each gene in the WallPair
-            for gene in wallpair_genes:
-                # if it's randomly selected to mutate, apply a mutation
-                    # of mut_effect_size in Guassian distribution
-                if per_site_mut_rate >= rand.uniform(0, 1):
-                    # angle gene
-                    if gene == "angle":
-                        wp.angle = wp.angle + rand.gauss(0,mut_effect_size)
-                        # if under min bound, set to min
-                        wp.angle = max(wp.angle, wp.MIN_ANGLE)
-                        # if over max bound, set to max
-                        wp.angle = min(wp.angle, wp.MAX_ANGLE)
-
-                    # ridge_height gene
-                    if gene == "ridge_height":
-                        wp.ridge_height = wp.ridge_height + rand.gauss(0,
-                                                                 mut_effect_size)
-                        # if under min bound, set to min
-                        wp.ridge_height = max(wp.ridge_height,
-                                              wp.MIN_RIDGE_HEIGHT)
-                        # if over max bound, set to max
-                        wp.ridge_height = min(wp.ridge_height,
-                                              wp.MAX_RIDGE_HEIGHT)
-
-                    # ridge_width_top gene
-                    if gene == "ridge_width_top":
-                        wp.ridge_width_top = (wp.ridge_width_top +
-                                              rand.gauss(0,
-                                                             mut_effect_size))
-                        # if under min bound, set to min
-                        wp.ridge_width_top = max(wp.ridge_width_top,
-                                                 wp.MIN_RIDGE_WIDTH_TOP)
-                        # if over max bound, set to max
-                        wp.ridge_width_top = min(wp.ridge_width_top,
-                                                 wp.MAX_RIDGE_WIDTH_TOP)
-
-                    # ridge_width_bottom gene
-                    if gene == "ridge_width_bottom":
-                        wp.ridge_width_bottom = (wp.ridge_width_bottom +
-                                                 rand.gauss(0, mut_effect_size))
-                        # if under min bound, set to min
-                        wp.ridge_width_bottom = max(wp.ridge_width_bottom,
-                                                    wp.MIN_RIDGE_WIDTH_BOTTOM)
-                        # if over max bound, set to max
-                        wp.ridge_width_bottom = min(wp.ridge_width_bottom,
-                                                    wp.MAX_RIDGE_WIDTH_BOTTOM)
-
-                    # ridge_thickness_top gene
-                    if gene == "ridge_thickness_top":
-                        wp.ridge_thickness_top = (wp.ridge_thickness_top +
-                                                  rand.gauss(0,
-                                                             mut_effect_size))
-                        # if under min bound, set to min
-                        wp.ridge_thickness_top = max(wp.ridge_thickness_top,
-                                                  wp.MIN_RIDGE_THICKNESS_TOP)
-                        # if over max bound, set to max
-                        wp.ridge_thickness_top = min(wp.ridge_thickness_top,
-                                                  wp.MAX_RIDGE_THICKNESS_TOP)
-
-                    # ridge_thickness_bottom gene
-                    if gene == "ridge_thickness_bottom":
-                        wp.ridge_thickness_bottom = (
-                                wp.ridge_thickness_bottom + rand.gauss(0,
-                                                                       mut_effect_size))
-                        # if under min bound, set to min
-                        wp.ridge_thickness_bottom = max(
-                            wp.ridge_thickness_bottom, wp.MIN_RIDGE_THICKNESS_BOTTOM)
-                        # if over max bound, set to max
-                        wp.ridge_width_bottom = min(
-                            wp.ridge_thickness_bottom, wp.MAX_RIDGE_THICKNESS_BOTTOM)
+        if not walls:
+            return
+
+        # Pre-draw all of the walls' randomness in one (W, 6) batch
+        u, g = _draw_mutation_batch(rand, (len(walls), len(self._WALL_GENES)), mut_effect_size)
+
+        vals = np.array([[getattr(wp, name) for name, _, _ in self._WALL_GENES] for wp in walls])
+
+        vals = _mutate_array(vals, WallPair.LOWS, WallPair.HIGHS,
+                             per_site_mut_rate, u, g)
+        for wp, row in zip(walls, vals.tolist(), strict=True):
+            for (name, _, _), value in zip(self._WALL_GENES, row, strict=True):
+                setattr(wp, name, value)
 
     # TODO KATE - func to construct from 2 parents with crossover (not for v1)
 
     # TODO ALEX - func to write Genotype genes to CSV line
+
+
+def _mutate_array(vals: np.ndarray, lows: np.ndarray, highs: np.ndarray,
+                  per_site_mut_rate: float, u: np.ndarray, g: np.ndarray) -> np.ndarray:
+    """
+    Apply a pre-drawn mutation to an array of gene values.
+
+    Applies a mutation of mut_effect_size in Gaussian distribution to the
+    randomly selected genes, clamped to the gene bounds. Pure ndarray-in,
+    ndarray-out math with no object access, so a JIT compiler (e.g. numba)
+    could be dropped on it without touching the Genotype class.
+
+    :param vals: Array of current gene values.
+    :type vals: np.ndarray
+    :param lows: Lower gene bounds, broadcastable against vals.
+    :type lows: np.ndarray
+    :param highs: Upper gene bounds, broadcastable against vals.
+    :type highs: np.ndarray
+    :param per_site_mut_rate: The % chance any given gene will be mutated.
+    :type per_site_mut_rate: float
+    :param u: Pre-drawn uniform [0, 1) values, same shape as vals.
+    :type u: np.ndarray
+    :param g: Pre-drawn Gaussian mutation deltas, same shape as vals.
+    :type g: np.ndarray
+    :return: The mutated gene values.
+    :rtype: np.ndarray
+    """
+    return np.clip(vals + (u <= per_site_mut_rate) * g, lows, highs)
+
+
+def make_mutate_fn(per_site_mut_rate: float, mut_effect_size: float) -> callable:
+    """
+    Bake a run's mutation constants into a specialized mutate closure.
+
+    per_site_mut_rate and mut_effect_size come from config once and never
+    change during a run, so a caller can build this closure at construction
+    time and stop threading the two floats through every hot-loop call; they
+    become closure-cell constants a JIT could fold into immediates.
+
+    :param per_site_mut_rate: The % chance any given gene will be mutated.
+    :type per_site_mut_rate: float
+    :param mut_effect_size: The mutation amplitude when a mutation occurs.
+    :type mut_effect_size: float
+    :return: A function (vals, lows, highs, rand) -> mutated vals that draws
+        its own randomness and applies the baked constants.
+    :rtype: callable
+    """
+    def mutate_fn(vals: np.ndarray, lows: np.ndarray, highs: np.ndarray,
+                  rand: random.Random | np.random.Generator) -> np.ndarray:
+        u, g = _draw_mutation_batch(rand, vals.shape, mut_effect_size)
+        return _mutate_array(vals, lows, highs, per_site_mut_rate, u, g)
+    return mutate_fn
+
+
+def _draw_mutation_batch(rand: random.Random | np.random.Generator,
+                         shape: int | tuple,
+                         mut_effect_size: float) -> tuple:
+    """
+    Draw the uniform and Gaussian arrays a mutation pass needs, in one batch.
+
+    With a numpy.random.Generator the draws come out of two compiled bulk
+    calls; a random.Random falls back to per-sample Python calls so existing
+    seeded runs keep their exact value stream.
+
+    :param rand: Random number generator object.
+    :type rand: random.Random | np.random.Generator
+    :param shape: Shape of the arrays to draw (an int or a tuple).
+    :type shape: int | tuple
+    :param mut_effect_size: Standard deviation of the Gaussian draws.
+    :type mut_effect_size: float
+    :return: A (u, g) pair of arrays of the requested shape.
+    :rtype: tuple
+    """
+    if isinstance(rand, np.random.Generator):
+        u = rand.random(shape)
+        g = rand.standard_normal(shape) * mut_effect_size
+    else:
+        size = int(np.prod(shape))
+        u = np.array([rand.uniform(0, 1) for _ in range(size)]).reshape(shape)
+        g = np.array([rand.gauss(0, mut_effect_size) for _ in range(size)]).reshape(shape)
+    return u, g
@@ -1,31 +1,70 @@
 """Class for managing the evolution of a population of antennas."""
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 from src.Evolver import NSGA2
-from src.Genotype import Genotype
+from src.Genotype import Genotype, make_mutate_fn
 from src.Parameters import ParametersObject
 from src.Phenotype import Phenotype
+from src.Population import Population
+from src.WallPair import WallPair
+
+# Maps the selection_scheme config value to its evolver class
+_SELECTION_SCHEMES = {
+    "NSGAII": NSGA2,
+}
+
+# Functional-equivalence fitness cache: canonical genotype tuple ->
+# fitness_score dict. Mutation regularly produces offspring functionally
+# identical to an ancestor (low per-site rates, hits on unexpressed ridge
+# genes); those individuals skip the expensive simulation entirely.
+_fitness_cache = {}
 
 
 class Manager:
     """Manager class."""
 
-    def __init__(self, cfg: ParametersObject) -> None:
-        """Constructor."""
-        self.seed = 1  #TODO read in from config
-        # coded
+    def __init__(self, cfg: ParametersObject, pe_rank: int = 0,
+                 pe_count: int = 1) -> None:
+        """
+        Constructor.
+
+        For island-model runs, each processing element builds its own
+        Manager with its rank and the total PE count: every island then gets
+        a deterministic but independent seed and an even share of the
+        configured population.
+
+        :param cfg: Configuration parameters object.
+        :type cfg: ParametersObject
+        :param pe_rank: This processing element's rank (0 for a single run).
+        :type pe_rank: int
+        :param pe_count: Total number of processing elements.
+        :type pe_count: int
+        :rtype: None
+        """
+        self.cfg = cfg
+        self.pe_rank = pe_rank
+        self.pe_count = pe_count
+        self.seed = 1 + pe_rank  #TODO read base seed in from config
+        # The PCG64 generator is the primary RNG: initialization, mutation,
+        # and any batched draws all come from it. self.rand remains only for
+        # the evolver's sequence-based tournament draws (sample/choice),
+        # which the Generator API does not cover for object lists.
+        self.rng = np.random.default_rng(self.seed)
         self.rand = random.Random(self.seed)
 
-        self.population = []
+        # Specialize the mutation kernel once with this run's constants
+        self._mutate_fn = make_mutate_fn(cfg.per_site_mut_rate,
+                                         cfg.mut_effect_size)
 
-        selection_scheme_convert_dict = {
-            "NSGAII": NSGA2,
-        }
+        self.population = []
 
-        if cfg.selection_scheme not in selection_scheme_convert_dict:
+        if cfg.selection_scheme not in _SELECTION_SCHEMES:
             raise ValueError("Invalid selection scheme")
 
-        self.selection_scheme = selection_scheme_convert_dict[cfg.selection_scheme]()
+        self.selection_scheme = _SELECTION_SCHEMES[cfg.selection_scheme]()
 
     def initialize_population(self, cfg: ParametersObject) -> None:
         """
@@ -38,18 +77,87 @@ class Manager:
         :type pop_size: int
         :rtype: None
         """
-        pop_size = cfg.population_size
+        # Island-model runs split the configured population across PEs; the
+        # first population_size % pe_count ranks take one extra individual
+        # so the global population always sums to population_size.
+        pop_size = (cfg.population_size // self.pe_count
+                    + (self.pe_rank < cfg.population_size % self.pe_count))
         initial_generation_num = 0
 
-        for individual in range(pop_size):
-            # create new random Genotype with 4 sides
-            g = Genotype(cfg).generate(2, self.rand)
+        # create new random Genotypes with 4 sides, one bulk draw per gene
+        genotypes = Genotype.generate_batch(cfg, pop_size, 2, self.rng)
+
+        # assign a phenotype to each genotype; building the list in one
+        # comprehension avoids pop_size incremental append/regrow steps.
+        # IDs are plain ints (None for no parent): no per-individual string
+        # allocation, and ID columns pack as int64 in the SoA buffer.
+        self.population = [Phenotype(g, individual, None, initial_generation_num)
+                           for individual, g in enumerate(genotypes)]
+
+    def mutate_population(self) -> None:
+        """
+        Mutate the whole population's genes in one vectorized pass.
+
+        Gathers every individual's genes into the struct-of-arrays Population
+        buffer, applies one masked-add-plus-clip over the (N, 3) core gene
+        matrix and one over the (N, W, 6) wall tensor, and scatters the
+        results back onto the Phenotypes. Equivalent to calling each
+        genotype's mutate in turn, minus the per-individual RNG calls.
+
+        :rtype: None
+        """
+        buf = Population.from_phenotypes(self.population)
 
-            # assign phenotype to genotype
-            p = Phenotype(g, str(individual), "None", initial_generation_num)
+        core_lows = np.array([self.cfg.MIN_HEIGHT, self.cfg.MIN_WAVEGUIDE_HEIGHT,
+                              self.cfg.MIN_WAVEGUIDE_LENGTH])
+        core_highs = np.array([self.cfg.MAX_HEIGHT, self.cfg.MAX_WAVEGUIDE_HEIGHT,
+                               self.cfg.MAX_WAVEGUIDE_LENGTH])
+        buf.genes = self._mutate_fn(buf.genes, core_lows, core_highs, self.rng)
+        buf.walls = self._mutate_fn(buf.walls, WallPair.LOWS, WallPair.HIGHS,
+                                    self.rng)
 
-            # append phenotype to population
-            self.population.append(p)
+        buf.scatter(self.population)
+
+    def _evaluate_population(self, evaluate_fn: callable) -> None:
+        """
+        Evaluate every individual's fitness, in parallel when configured.
+
+        Each evaluation is independent, so the jobs are farmed out to worker
+        processes. Jobs are plain (genes, walls, has_ridge) row tuples rather
+        than Phenotype objects so pickling stays cheap; the has_ridge flags
+        tell evaluate_fn which walls express their ridge genes, keeping the
+        payload consistent with the canonical cache key. evaluate_fn must be
+        a module-level function taking one such tuple and returning the
+        individual's fitness_score dict.
+
+        :param evaluate_fn: Picklable function mapping a (genes, walls,
+        has_ridge) tuple to a fitness_score dict.
+        :type evaluate_fn: callable
+        :rtype: None
+        """
+        buf = Population.from_phenotypes(self.population)
+
+        # Only cache misses are evaluated; functional duplicates reuse the
+        # cached score.
+        keys = [p.genotype.canonical_tuple() for p in self.population]
+        miss = [i for i, key in enumerate(keys) if key not in _fitness_cache]
+        jobs = [(buf.genes[i].tolist(), buf.walls[i].tolist(),
+                 [wp.has_ridge for wp in self.population[i].genotype.walls])
+                for i in miss]
+
+        if self.cfg.parallel_evaluation and jobs:
+            workers = self.cfg.max_workers or os.cpu_count()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunksize = max(1, len(jobs) // (8 * workers))
+                scores = list(executor.map(evaluate_fn, jobs, chunksize=chunksize))
+        else:
+            scores = [evaluate_fn(job) for job in jobs]
+
+        for i, score in zip(miss, scores, strict=True):
+            _fitness_cache[keys[i]] = score
+
+        for phenotype, key in zip(self.population, keys, strict=True):
+            phenotype.fitness_score = _fitness_cache[key]
 
     def evolve_one_gen(self, generation_num: int) -> None:
         """
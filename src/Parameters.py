@@ -1,10 +1,26 @@
 """The parameters class store any config information we want to be able to easily modify via a toml file."""
+from functools import lru_cache
+from pathlib import Path
 
 try:
     from tomllib import load
 except ModuleNotFoundError:
     from tomli import load
 
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_to_config: str, _mtime: float) -> dict:
+    """
+    Parse a config file, cached on (path, mtime).
+
+    Re-instantiating ParametersObject for the same file — e.g. one per
+    worker or per island — hits the cache instead of re-reading and
+    re-parsing the TOML from disk; editing the file changes its mtime and
+    naturally invalidates the entry.
+    """
+    with open(path_to_config, "rb") as f:
+        return load(f)
+
 known_parameters = {
     "population_size": int,
     "num_generations": int,
@@ -17,6 +33,8 @@ known_parameters = {
     "MAX_WAVEGUIDE_HEIGHT": float,
     "MIN_WAVEGUIDE_LENGTH": float,
     "MAX_WAVEGUIDE_LENGTH": float,
+    "parallel_evaluation": bool,
+    "max_workers": int,
 }
 
 class ParametersObject:
@@ -24,8 +42,9 @@ class ParametersObject:
 
     def __init__(self, path_to_config: str) -> None:
         """Create a config object from a file."""
-        with open(path_to_config, "rb") as f:
-            self._parameters = load(f)
+        mtime = Path(path_to_config).stat().st_mtime
+        # Copy so one instance's view can never mutate the shared cache entry
+        self._parameters = _load_config_cached(path_to_config, mtime).copy()
 
         print(f"{len(self._parameters)} parameters set by {path_to_config} .")
 
@@ -43,10 +62,23 @@ class ParametersObject:
             if param_name not in self._parameters:
                 raise ValueError(f"Parameter {param_name} not set!")
 
+        # Promote the validated values to real instance attributes so hot
+        # loops read them as plain slot lookups; __getattr__ only fires for
+        # names that were never loaded.
+        for name, value in self._parameters.items():
+            object.__setattr__(self, name, value)
+
+        # Push the loaded gene bounds onto the Genotype class so its
+        # hard-coded defaults can never shadow the config's values; the
+        # config is the one canonical source of the bounds. Imported here
+        # rather than at module level because Genotype imports this module.
+        from src.Genotype import Genotype  # noqa: PLC0415
+        for bound in ("MIN_HEIGHT", "MAX_HEIGHT",
+                      "MIN_WAVEGUIDE_HEIGHT", "MAX_WAVEGUIDE_HEIGHT",
+                      "MIN_WAVEGUIDE_LENGTH", "MAX_WAVEGUIDE_LENGTH"):
+            setattr(Genotype, bound, self._parameters[bound])
+
 
     def __getattr__(self, name: str) -> str:
-        """Get a requested attribute."""
-        _params = object.__getattribute__(self, "_parameters")
-        if name not in _params:
-            raise AttributeError(f"{name} is not a defined parameter!")
-        return _params[name]
+        """Raise for attribute names that are not defined parameters."""
+        raise AttributeError(f"{name} is not a defined parameter!")
@@ -1,8 +1,9 @@
 """Class for constructing an antenna's Phenotype and acting upon it."""
-import copy
 import random
 from typing import Optional
 
+import numpy as np
+
 
 class Phenotype:
     """
@@ -14,18 +15,34 @@ class Phenotype:
     :param genotype: a Genotype instance.
     :type genotype: Genotype
     :param indv_id: The individual's unique ID.
-    :type indv_id: str, optional
-    :param parent_id: The individual's parent's unique ID.
-    :type parent_id: str, optional
+    :type indv_id: int, optional
+    :param parent_id: The individual's parent's unique ID, or None for the
+    initial generation.
+    :type parent_id: int, optional
     :param generation_created: Which generation the individual was created.
     :type generation_created: int, optional
     :param fitness_score: The fitness score of the individual.
     :type fitness_score: float, optional
     """
 
+    # A fixed slot layout instead of a per-instance __dict__: populations
+    # allocate one Phenotype per individual per generation, and the slots cut
+    # both the memory per instance and the attribute-lookup indirection.
+    __slots__ = (
+        "_fitness",
+        "fitness_score",
+        "fvec",
+        "generation_created",
+        "genotype",
+        "indv_id",
+        "nsgaii_distance",
+        "nsgaii_rank",
+        "parent_id",
+    )
+
     def __init__(self, genotype: object,
-                 indv_id: Optional[str],
-                 parent_id: Optional[str],
+                 indv_id: Optional[int],
+                 parent_id: Optional[int],
                  generation_created: Optional[int]) -> None:
         """
         Phenotype constructor.
@@ -35,9 +52,10 @@ class Phenotype:
         :param genotype: a Genotype instance.
         :type genotype: Genotype
         :param indv_id: The individual's unique ID.
-        :type indv_id: str, optional
-        :param parent_id: The individual's parent's unique ID.
-        :type parent_id: str, optional
+        :type indv_id: int, optional
+        :param parent_id: The individual's parent's unique ID, or None for
+        the initial generation.
+        :type parent_id: int, optional
         :param generation_created: Which generation the individual was created.
         :type generation_created: int, optional
         :rtype: None
@@ -48,6 +66,114 @@ class Phenotype:
         self.generation_created = generation_created
         self.fitness_score = None # TODO replace with calc_fitness_score call
 
+    @property
+    def fitness(self) -> dict:
+        """
+        The individual's fitness dict, keyed by objective name.
+
+        Implemented as a property so that reassigning it also drops the
+        cached fitness vector the evolver's dominance comparisons read;
+        otherwise a re-evaluated survivor would keep ranking on its old
+        values.
+
+        :return: The fitness dict.
+        :rtype: dict
+        """
+        return self._fitness
+
+    @fitness.setter
+    def fitness(self, value: dict) -> None:
+        self._fitness = value
+        self.fvec = None
+
+    def clone(self) -> object:
+        """
+        Copy this Phenotype with direct attribute stores.
+
+        Allocates the new instance with __new__, clones the genotype, and
+        assigns the identity fields by value — a handful of stores instead
+        of deepcopy's reflective walk over the whole object graph. The
+        cached fitness vector is deliberately not carried over; a clone is
+        expected to be mutated and re-evaluated.
+
+        :return: A new Phenotype wrapping a copy of this one's genotype.
+        :rtype: Phenotype
+        """
+        cls = type(self)
+        new = cls.__new__(cls)
+        new.genotype = self.genotype.clone()
+        new.indv_id = self.indv_id
+        new.parent_id = self.parent_id
+        new.generation_created = self.generation_created
+        score = self.fitness_score
+        new.fitness_score = dict(score) if isinstance(score, dict) else score
+        # The evolver's combined sort reads offspring .fitness before any
+        # re-evaluation, so the parent's dict is carried over by value.
+        try:
+            fitness = self.fitness
+        except AttributeError:
+            pass
+        else:
+            new.fitness = dict(fitness) if isinstance(fitness, dict) else fitness
+        return new
+
+    def __copy__(self) -> object:
+        """Copy this Phenotype via clone()."""
+        return self.clone()
+
+    @staticmethod
+    def make_offspring_batch(parents: list, new_ids: list,
+                             generation_num: int,
+                             rng: np.random.Generator) -> list:
+        """
+        Make one offspring per parent with a single batched mutation pass.
+
+        Clones every parent, then mutates the whole batch at once: the
+        offspring's core genes and wall genes are gathered into the SoA
+        Population buffer, mutated with two bulk RNG draws and two masked
+        add-plus-clip passes, and scattered back. Amortizes the per-child
+        Python and RNG overhead of calling make_offspring per parent.
+
+        :param parents: The selected parents, one per offspring.
+        :type parents: list
+        :param new_ids: The new individuals' IDs, in parent order.
+        :type new_ids: list
+        :param generation_num: The generation the offspring are created in.
+        :type generation_num: int
+        :param rng: Random number generator object.
+        :type rng: np.random.Generator
+        :return: The list of mutated offspring.
+        :rtype: list
+        """
+        # Imported here: Population imports this module
+        from src.Genotype import Genotype, _draw_mutation_batch, _mutate_array  # noqa: PLC0415
+        from src.Population import Population  # noqa: PLC0415
+        from src.WallPair import WallPair  # noqa: PLC0415
+
+        offspring = []
+        for parent, new_id in zip(parents, new_ids, strict=True):
+            child = parent.clone()
+            child.parent_id = parent.indv_id
+            child.indv_id = new_id
+            child.generation_created = generation_num
+            offspring.append(child)
+
+        cfg = offspring[0].genotype.cfg
+        buf = Population.from_phenotypes(offspring)
+
+        # Bounds resolve through the class attributes (config-canonical)
+        core_lows = np.array([getattr(Genotype, lo) for _, lo, _ in Genotype.CORE_GENES])
+        core_highs = np.array([getattr(Genotype, hi) for _, _, hi in Genotype.CORE_GENES])
+        u, g = _draw_mutation_batch(rng, buf.genes.shape, cfg.mut_effect_size)
+        buf.genes = _mutate_array(buf.genes, core_lows, core_highs,
+                                  cfg.per_site_mut_rate, u, g)
+        u, g = _draw_mutation_batch(rng, buf.walls.shape, cfg.mut_effect_size)
+        buf.walls = _mutate_array(buf.walls, WallPair.LOWS, WallPair.HIGHS,
+                                  cfg.per_site_mut_rate, u, g)
+
+        buf.scatter(offspring)
+        return offspring
+
     def make_offspring(self, new_id: int, rand: random.Random) -> object:
         """
         Make offspring.
@@ -63,7 +189,7 @@ class Phenotype:
         :rtype: None
         """
         # make a copy of parent 1 to be the offspring
-        offspring = copy.deepcopy(self)
+        offspring = self.clone()
         # set fields for new_indiv
         offspring.parent_id = self.indv_id
         offspring.indv_id = new_id
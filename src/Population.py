@@ -0,0 +1,176 @@
+"""
+Structure-of-arrays buffer for a population's Genotype genes.
+
+Population-level operations (batched mutation, fitness aggregation, CSV
+export) are much cheaper on contiguous NumPy columns than on a list of
+Phenotype objects, where every pass chases N pointers and does per-attribute
+dict lookups. This module provides:
+- Population.from_phenotypes: gather a phenotype list into SoA arrays
+- Population.scatter: write the arrays back onto the phenotype objects
+"""
+import numpy as np
+from src.Genotype import Genotype
+from src.Phenotype import Phenotype
+from src.WallPair import WallPair
+
+# Order of the core Genotype genes in the genes matrix
+CORE_GENES = ("height", "waveguide_height", "waveguide_length")
+
+# Order of the WallPair genes in the walls tensor
+WALL_GENES = ("angle", "ridge_height", "ridge_width_top", "ridge_width_bottom",
+              "ridge_thickness_top", "ridge_thickness_bottom")
+
+
+class Population:
+    """
+    Population class.
+
+    Holds one population's genes in struct-of-arrays layout: an (N, 3) matrix
+    of core Genotype genes and an (N, W, 6) tensor of WallPair genes. The
+    Phenotype objects stay the canonical representation; this buffer is a
+    working view for vectorized batch operations.
+
+    :param genes: An (N, 3) float64 matrix of core genes, columns ordered as
+        CORE_GENES.
+    :type genes: np.ndarray
+    :param walls: An (N, W, 6) float64 tensor of wall genes, last axis
+        ordered as WALL_GENES.
+    :type walls: np.ndarray
+    :param ids: The N individual IDs, in buffer order.
+    :type ids: list, optional
+    :param parent_ids: The N parent IDs, in buffer order.
+    :type parent_ids: list, optional
+    :param gen_created: An (N,) int64 array of creation generation numbers.
+    :type gen_created: np.ndarray, optional
+    :param fitness: An (N, M) float64 matrix of fitness scores, columns
+        ordered as fitness_metrics.
+    :type fitness: np.ndarray, optional
+    :param fitness_metrics: The M fitness metric names naming the fitness
+        matrix columns.
+    :type fitness_metrics: list, optional
+    :param rank: An (N,) int32 array of NSGA-II ranks.
+    :type rank: np.ndarray, optional
+    :param dist: An (N,) float64 array of NSGA-II crowding distances.
+    :type dist: np.ndarray, optional
+    """
+
+    def __init__(self, genes: np.ndarray, walls: np.ndarray,
+                 ids: list | None = None, parent_ids: list | None = None,
+                 gen_created: np.ndarray | None = None,
+                 fitness: np.ndarray | None = None,
+                 fitness_metrics: list | None = None,
+                 rank: np.ndarray | None = None,
+                 dist: np.ndarray | None = None) -> None:
+        """
+        Population constructor.
+
+        :param genes: An (N, 3) float64 matrix of core genes.
+        :type genes: np.ndarray
+        :param walls: An (N, W, 6) float64 tensor of wall genes.
+        :type walls: np.ndarray
+        :param ids: The N individual IDs, in buffer order.
+        :type ids: list, optional
+        :param parent_ids: The N parent IDs, in buffer order.
+        :type parent_ids: list, optional
+        :param gen_created: An (N,) int64 array of creation generations.
+        :type gen_created: np.ndarray, optional
+        :param fitness: An (N, M) float64 matrix of fitness scores.
+        :type fitness: np.ndarray, optional
+        :param fitness_metrics: The M fitness metric names.
+        :type fitness_metrics: list, optional
+        :rtype: None
+        """
+        self.genes = genes
+        self.walls = walls
+        self.ids = ids
+        self.parent_ids = parent_ids
+        self.gen_created = gen_created
+        self.fitness = fitness
+        self.fitness_metrics = fitness_metrics
+        self.rank = rank
+        self.dist = dist
+
+    def __len__(self) -> int:
+        """Number of individuals in the buffer."""
+        return self.genes.shape[0]
+
+    @classmethod
+    def from_phenotypes(cls, population: list) -> object:
+        """
+        Gather a list of Phenotypes into a Population buffer.
+
+        :param population: A list of Phenotype objects.
+        :type population: list
+        :return: A Population holding copies of the phenotypes' genes.
+        :rtype: Population
+        """
+        genes = np.array([[getattr(p.genotype, gene) for gene in CORE_GENES]
+                          for p in population], dtype=np.float64)
+        walls = np.array([[[getattr(wp, gene) for gene in WALL_GENES]
+                           for wp in p.genotype.walls]
+                          for p in population], dtype=np.float64)
+        ids = [p.indv_id for p in population]
+        parent_ids = [p.parent_id for p in population]
+        gen_created = np.array([p.generation_created for p in population],
+                               dtype=np.int64)
+
+        # Fitness columns are only gathered once the population is evaluated
+        fitness = None
+        fitness_metrics = None
+        if population and getattr(population[0], "fitness_score", None):
+            fitness_metrics = list(population[0].fitness_score)
+            fitness = np.array([[p.fitness_score[metric] for metric in fitness_metrics]
+                                for p in population], dtype=np.float64)
+        # NSGA-II bookkeeping columns exist only after a sort has run; the
+        # contiguous copies let tournament sweeps read two scalars per
+        # comparison instead of chasing two object pointers.
+        rank = None
+        dist = None
+        if population and hasattr(population[0], "nsgaii_rank"):
+            rank = np.array([p.nsgaii_rank for p in population], dtype=np.int32)
+        if population and hasattr(population[0], "nsgaii_distance"):
+            dist = np.array([p.nsgaii_distance for p in population], dtype=np.float64)
+        return cls(genes, walls, ids, parent_ids, gen_created,
+                   fitness, fitness_metrics, rank, dist)
+
+    def scatter(self, population: list) -> None:
+        """
+        Write the buffer's genes back onto a list of Phenotypes.
+
+        :param population: The list of Phenotype objects the buffer was
+            gathered from (same order and length).
+        :type population: list
+        :rtype: None
+        """
+        for i, p in enumerate(population):
+            for m, gene in enumerate(CORE_GENES):
+                setattr(p.genotype, gene, float(self.genes[i, m]))
+            for w, wp in enumerate(p.genotype.walls):
+                for m, gene in enumerate(WALL_GENES):
+                    setattr(wp, gene, float(self.walls[i, w, m]))
+
+    def as_phenotype(self, i: int, cfg: object) -> Phenotype:
+        """
+        Materialize one buffer row as a fresh Phenotype object.
+
+        For code paths that still expect the object form after the buffer's
+        arrays have been produced without backing Phenotypes.
+
+        :param i: Index of the individual in the buffer.
+        :type i: int
+        :param cfg: Configuration parameters object for the new Genotype.
+        :type cfg: ParametersObject
+        :return: A new Phenotype built from row i's genes.
+        :rtype: Phenotype
+        """
+        wall_pairs = [WallPair(*row) for row in self.walls[i].tolist()]
+        genotype = Genotype(cfg, *self.genes[i].tolist(), walls=wall_pairs)
+        indv_id = self.ids[i] if self.ids is not None else str(i)
+        parent_id = self.parent_ids[i] if self.parent_ids is not None else "None"
+        generation = int(self.gen_created[i]) if self.gen_created is not None else 0
+        phenotype = Phenotype(genotype, indv_id, parent_id, generation)
+        if self.fitness is not None:
+            phenotype.fitness_score = dict(zip(self.fitness_metrics,
+                                               self.fitness[i].tolist(),
+                                               strict=True))
+        return phenotype
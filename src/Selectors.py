@@ -1,17 +1,23 @@
 """Abstract selector class defines the interface for all selection algorithms."""
 
 import random
-from abc import ABC, abstractmethod
 
+import numpy as np
 from src.Phenotype import Phenotype
 
 
-class AbstractSelector(ABC):
-    """Each selector chooses one parent from a selection pool."""
+class AbstractSelector:
+    """
+    Each selector chooses one parent from a selection pool.
+
+    A plain base class rather than an ABC: select_one runs O(population x
+    generations) times, and the ABC metaclass hooks add per-call overhead
+    for no safety a one-method interface needs.
+    """
 
-    @abstractmethod
     def select_one(self, selection_pool: list[Phenotype], rand: random.Random) -> Phenotype:
         """Given a list of Phenotype objects, select on to be a parent."""
+        raise NotImplementedError
 
 
 class NSGATournament(AbstractSelector):
@@ -19,7 +25,16 @@ class NSGATournament(AbstractSelector):
 
     def select_one(self, selection_pool: list[Phenotype], rand: random.Random) -> Phenotype:
         """Choose between two random individuals based on rank, then crowding distance."""
-        i1, i2 = rand.sample(selection_pool, 2)
+        # Draw two distinct indices directly: the second draw picks from the
+        # n-1 remaining slots and shifts past the first index, avoiding
+        # sample's list allocation and selection-set bookkeeping on every
+        # tournament.
+        n = len(selection_pool)
+        i = rand.randrange(n)
+        j = rand.randrange(n - 1)
+        j += (j >= i)
+        i1 = selection_pool[i]
+        i2 = selection_pool[j]
 
         # Compare rank
         if i1.nsgaii_rank < i2.nsgaii_rank:
@@ -35,3 +50,42 @@ class NSGATournament(AbstractSelector):
 
         # Randomly break ties
         return rand.choice([i1, i2])
+
+    def select_index(self, rank: np.ndarray, dist: np.ndarray,
+                     rand: random.Random) -> int:
+        """
+        Run one binary tournament over SoA rank/distance arrays.
+
+        Array-indexed twin of select_one for callers holding a Population
+        buffer: each comparison reads two scalars from contiguous arrays
+        instead of chasing two Phenotype pointers.
+
+        :param rank: An (N,) array of NSGA-II ranks.
+        :param dist: An (N,) array of NSGA-II crowding distances.
+        :param rand: Random number generator object.
+        :return: The winning individual's index into the arrays.
+        """
+        n = len(rank)
+        i = rand.randrange(n)
+        j = rand.randrange(n - 1)
+        j += (j >= i)
+
+        # Compare rank
+        if rank[i] < rank[j]:
+            return i
+        elif rank[j] < rank[i]:
+            return j
+
+        # Compare distance
+        if dist[i] > dist[j]:
+            return i
+        elif dist[j] > dist[i]:
+            return j
+
+        # Randomly break ties
+        return rand.choice([i, j])
+
+
+# Dict-dispatched registry: callers resolve the selector once by name and
+# bind its method to a local before entering the generation loop.
+SELECTORS = {"NSGAII": NSGATournament}
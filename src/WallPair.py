@@ -6,9 +6,16 @@ This module provides:
 - generate_with_ridge: randomly generates a WallPair with a ridge.
 - generate_list: randomly generates a list of WallPairs.
 """
+import math
 import random
 from typing import Optional
 
+import numpy as np
+
+# Smallest positive float: the clamp value for ridge genes that must be
+# strictly positive
+_RIDGE_EPS = math.nextafter(0.0, 1.0)
+
 
 class WallPair:
     """
@@ -57,6 +64,26 @@ class WallPair:
     # the horn; inclusive
     MAX_RIDGE_THICKNESS_BOTTOM = 100.0  # %; inclusive
 
+    # Schema of the wall genes: column order for any packed array form, and
+    # the naming scheme the MIN_/MAX_ bound constants above follow.
+    PARAM_NAMES = ("angle", "ridge_height", "ridge_width_top",
+                   "ridge_width_bottom", "ridge_thickness_top",
+                   "ridge_thickness_bottom")
+
+    # The same bounds stacked as vectors in PARAM_NAMES order, built once at
+    # class definition so batched draws broadcast against them directly
+    # instead of re-assembling six attribute lookups per call.
+    LOWS = np.array([MIN_ANGLE, MIN_RIDGE_HEIGHT, MIN_RIDGE_WIDTH_TOP,
+                     MIN_RIDGE_WIDTH_BOTTOM, MIN_RIDGE_THICKNESS_TOP,
+                     MIN_RIDGE_THICKNESS_BOTTOM], dtype=np.float64)
+    HIGHS = np.array([MAX_ANGLE, MAX_RIDGE_HEIGHT, MAX_RIDGE_WIDTH_TOP,
+                      MAX_RIDGE_WIDTH_BOTTOM, MAX_RIDGE_THICKNESS_TOP,
+                      MAX_RIDGE_THICKNESS_BOTTOM], dtype=np.float64)
+
+    # Fixed slot layout: every individual owns num_wall_pairs of these, so
+    # dropping the per-instance __dict__ pays off across a population.
+    __slots__ = ("has_ridge", *PARAM_NAMES)
+
     def __init__(self, angle: Optional[float] = None,
                  ridge_height: Optional[float] = None,
                  ridge_width_top: Optional[float] = None,
@@ -105,32 +132,42 @@ class WallPair:
 
         Generates a random WallPair object with no ridge.
 
-        :param rand: The random number generator.
+        :param rand: The random number generator (random.Random or
+        numpy.random.Generator; both expose the scalar uniform API used
+        here).
         :type rand: class:'random.Random'
         :return: A randomly generated WallPair object with no ridge.
         :rtype: WallPair object
         """
+        # Inline uniform's a + (b-a)*random() transform with the random()
+        # method bound to a local: same values, without uniform's extra
+        # method call and attribute lookup per gene.
+        r = rand.random
+
         # Generate a random angle within the specified constraints
-        angle = rand.uniform(WallPair.MIN_ANGLE, WallPair.MAX_ANGLE)
+        angle = WallPair.MIN_ANGLE + (
+            WallPair.MAX_ANGLE - WallPair.MIN_ANGLE) * r()
 
         # Generate a random ridge_height within the specified constraints
-        ridge_height = rand.uniform(WallPair.MIN_RIDGE_HEIGHT,
-                                      WallPair.MAX_RIDGE_HEIGHT)
+        ridge_height = WallPair.MIN_RIDGE_HEIGHT + (
+            WallPair.MAX_RIDGE_HEIGHT - WallPair.MIN_RIDGE_HEIGHT) * r()
 
         # Generate a random ridge_width within the specified constraints
-        ridge_width_top = rand.uniform(WallPair.MIN_RIDGE_WIDTH_TOP,
-                                     WallPair.MAX_RIDGE_WIDTH_TOP)
+        ridge_width_top = WallPair.MIN_RIDGE_WIDTH_TOP + (
+            WallPair.MAX_RIDGE_WIDTH_TOP - WallPair.MIN_RIDGE_WIDTH_TOP) * r()
 
-        ridge_width_bottom = rand.uniform(WallPair.MIN_RIDGE_WIDTH_BOTTOM,
-                                       WallPair.MAX_RIDGE_WIDTH_BOTTOM)
+        ridge_width_bottom = WallPair.MIN_RIDGE_WIDTH_BOTTOM + (
+            WallPair.MAX_RIDGE_WIDTH_BOTTOM
+            - WallPair.MIN_RIDGE_WIDTH_BOTTOM) * r()
 
         # Generate a random ridge_thickness within the specified constraints
-        ridge_thickness_top = rand.uniform(WallPair.MIN_RIDGE_THICKNESS_TOP,
-                                         WallPair.MAX_RIDGE_THICKNESS_TOP)
+        ridge_thickness_top = WallPair.MIN_RIDGE_THICKNESS_TOP + (
+            WallPair.MAX_RIDGE_THICKNESS_TOP
+            - WallPair.MIN_RIDGE_THICKNESS_TOP) * r()
 
-        ridge_thickness_bottom = rand.uniform(
-            WallPair.MIN_RIDGE_THICKNESS_BOTTOM,
-                                       WallPair.MAX_RIDGE_THICKNESS_BOTTOM)
+        ridge_thickness_bottom = WallPair.MIN_RIDGE_THICKNESS_BOTTOM + (
+            WallPair.MAX_RIDGE_THICKNESS_BOTTOM
+            - WallPair.MIN_RIDGE_THICKNESS_BOTTOM) * r()
 
         return WallPair(angle, ridge_height, ridge_width_top, ridge_width_bottom,
                         ridge_thickness_top, ridge_thickness_bottom)
@@ -139,42 +176,124 @@ class WallPair:
         """
         Generates a random WallPair object with a ridge.
 
-        :param rand: The random number generator.
+        :param rand: The random number generator (random.Random or
+        numpy.random.Generator; both expose the scalar uniform API used
+        here).
         :type rand: class:'random.Random'
         :return: A randomly generated WallPair object with a ridge.
         :rtype: WallPair object
         """
-        # Randomly generate a WallPair object without a ridge
-        wp = WallPair().generate_without_ridge(rand)
+        # Draw straight into locals and build one WallPair, instead of
+        # delegating through generate_without_ridge (which costs a second,
+        # throwaway allocation). Same transform and draw order, so the
+        # values are identical.
+        r = rand.random
+
+        angle = WallPair.MIN_ANGLE + (
+            WallPair.MAX_ANGLE - WallPair.MIN_ANGLE) * r()
+
+        # Ridge genes must be strictly positive. A continuous uniform hits
+        # exactly 0.0 only when the underlying random() returns 0.0, so
+        # instead of a rejection loop per gene, clamp that measure-zero case
+        # to the smallest positive float; every nonzero draw passes through
+        # unchanged.
+        ridge_height = max(WallPair.MIN_RIDGE_HEIGHT + (
+            WallPair.MAX_RIDGE_HEIGHT - WallPair.MIN_RIDGE_HEIGHT) * r(),
+            _RIDGE_EPS)
+
+        ridge_width_top = max(WallPair.MIN_RIDGE_WIDTH_TOP + (
+            WallPair.MAX_RIDGE_WIDTH_TOP
+            - WallPair.MIN_RIDGE_WIDTH_TOP) * r(), _RIDGE_EPS)
+
+        ridge_width_bottom = max(WallPair.MIN_RIDGE_WIDTH_BOTTOM + (
+            WallPair.MAX_RIDGE_WIDTH_BOTTOM
+            - WallPair.MIN_RIDGE_WIDTH_BOTTOM) * r(), _RIDGE_EPS)
+
+        ridge_thickness_top = max(WallPair.MIN_RIDGE_THICKNESS_TOP + (
+            WallPair.MAX_RIDGE_THICKNESS_TOP
+            - WallPair.MIN_RIDGE_THICKNESS_TOP) * r(), _RIDGE_EPS)
+
+        ridge_thickness_bottom = max(WallPair.MIN_RIDGE_THICKNESS_BOTTOM + (
+            WallPair.MAX_RIDGE_THICKNESS_BOTTOM
+            - WallPair.MIN_RIDGE_THICKNESS_BOTTOM) * r(), _RIDGE_EPS)
+
+        wp = WallPair(angle, ridge_height, ridge_width_top,
+                      ridge_width_bottom, ridge_thickness_top,
+                      ridge_thickness_bottom)
 
-        # Ensure none of the ridge-defining variables are set to 0
-        while wp.ridge_height == 0:
-            wp.ridge_height = rand.uniform(WallPair.MIN_RIDGE_HEIGHT,
-                                             WallPair.MAX_RIDGE_HEIGHT)
+        # Express ridge
+        wp.has_ridge = True
 
-        while wp.ridge_width_top == 0:
-            wp.ridge_width_top = rand.uniform(WallPair.MIN_RIDGE_WIDTH_TOP,
-                                            WallPair.MAX_RIDGE_WIDTH_TOP)
+        return wp
 
-        while wp.ridge_width_bottom == 0:
-            wp.ridge_width_bottom = rand.uniform(
-                WallPair.MIN_RIDGE_WIDTH_BOTTOM,
-                WallPair.MAX_RIDGE_WIDTH_BOTTOM)
+    def canonical_tuple(self) -> tuple:
+        """
+        Return the functionally expressed wall genes as a hashable tuple.
 
-        while wp.ridge_thickness_top == 0:
-            wp.ridge_thickness_top = rand.uniform(
-                WallPair.MIN_RIDGE_THICKNESS_TOP,
-                WallPair.MAX_RIDGE_THICKNESS_TOP)
+        Zeros the ridge genes by multiplying with a 0/1 mask instead of
+        branching on has_ridge, so the tuple always has one slot per gene
+        and wall pairs whose unexpressed ridge genes differ still collide.
+        Feeds the Genotype-level functional-equivalence cache key.
 
-        while wp.ridge_thickness_bottom == 0:
-            wp.ridge_thickness_bottom = rand.uniform(
-                WallPair.MIN_RIDGE_THICKNESS_BOTTOM,
-                WallPair.MAX_RIDGE_THICKNESS_BOTTOM)
+        :return: A fixed-length tuple of the expressed gene values.
+        :rtype: tuple
+        """
+        m = 1.0 if self.has_ridge else 0.0
+        return (self.angle, self.ridge_height * m, self.ridge_width_top * m,
+                self.ridge_width_bottom * m, self.ridge_thickness_top * m,
+                self.ridge_thickness_bottom * m)
 
-        # Express ridge
-        wp.has_ridge = True
+    def __copy__(self) -> object:
+        """
+        Copy this WallPair with direct attribute stores.
 
-        return wp
+        Allocates the new instance with __new__ and assigns the seven known
+        attributes, skipping the reflection-driven copy machinery.
+
+        :return: A new WallPair with the same gene values.
+        :rtype: WallPair object
+        """
+        new = WallPair.__new__(WallPair)
+        new.has_ridge = self.has_ridge
+        new.angle = self.angle
+        new.ridge_height = self.ridge_height
+        new.ridge_width_top = self.ridge_width_top
+        new.ridge_width_bottom = self.ridge_width_bottom
+        new.ridge_thickness_top = self.ridge_thickness_top
+        new.ridge_thickness_bottom = self.ridge_thickness_bottom
+        return new
+
+    @classmethod
+    def generate_array(cls, num_wall_pairs: int, rng: np.random.Generator,
+                       size: Optional[int] = None) -> np.ndarray:
+        """
+        Generates wall genes as a packed float64 array with one bulk draw.
+
+        Draws every wall gene in a single rng.uniform call over the stacked
+        bound vectors, producing a (num_wall_pairs, k) array — or
+        (size, num_wall_pairs, k) for a whole population — with columns
+        ordered as PARAM_NAMES. The array form carries genes only; it has no
+        has_ridge flag.
+
+        :param num_wall_pairs: The number of wall pairs to generate. Must be
+        greater than zero.
+        :type num_wall_pairs: int
+        :param rng: The random number generator.
+        :type rng: np.random.Generator
+        :param size: Number of individuals to draw walls for, or None for a
+        single individual's (num_wall_pairs, k) array.
+        :type size: int, optional
+        :return: A float64 array of wall genes.
+        :rtype: np.ndarray
+        """
+        # Throw a ValueError if num_wall_pairs is <= 0
+        if num_wall_pairs <= 0:
+            raise ValueError("num_wall_pairs must be greater than zero.")
+
+        shape = (num_wall_pairs, len(cls.PARAM_NAMES))
+        if size is not None:
+            shape = (size, *shape)
+        return rng.uniform(cls.LOWS, cls.HIGHS, shape)
 
     def generate_list(self, num_wall_pairs: int, rand: random.Random) -> list:
         """
@@ -182,7 +301,9 @@ class WallPair:
 
         :param num_wall_pairs: The number of wall pairs to generate. Must be greater than zero.
         :type num_wall_pairs: int
-        :param rand: The random number generator.
+        :param rand: The random number generator (random.Random or
+        numpy.random.Generator; both expose the scalar uniform API used
+        here).
         :type rand: class:'random.Random'
         :return: A list of randomly generated WallPair objects.
         :rtype: list[WallPair object]
@@ -191,13 +312,21 @@ class WallPair:
         if num_wall_pairs <= 0:
             raise ValueError("num_wall_pairs must be greater than zero.")
 
-        # Generate random wall pairs and add them to a list
+        # Draw every wall gene in one batch, plus one batched coin flip per
+        # pair for ridge expression. A random.Random caller seeds a
+        # temporary Generator so both RNG kinds get the batch path; this
+        # also keeps the coin flips on the caller's seeded stream instead of
+        # the global random module.
+        rng = (rand if isinstance(rand, np.random.Generator)
+               else np.random.default_rng(rand.randrange(1 << 63)))
+        params = WallPair.generate_array(num_wall_pairs, rng)
+        # TODO: decide whether ridge expression should stay at equal odds
+        has_ridge = rng.integers(0, 2, size=num_wall_pairs, dtype=bool)
+
         walls = []
-        for _ in range(num_wall_pairs):
-            # Randomly select type of wall pair to generate (ridge or no ridge)
-            if random.randint(0,1) == 0:  #TODO do we actually want these to
-                # be equal odds?
-                walls.append(WallPair().generate_without_ridge(rand))
-            else:
-                walls.append(WallPair().generate_with_ridge(rand))
+        for row, ridged in zip(params.tolist(), has_ridge.tolist(),
+                               strict=True):
+            wp = WallPair(*row)
+            wp.has_ridge = ridged
+            walls.append(wp)
         return walls
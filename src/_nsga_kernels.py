@@ -0,0 +1,184 @@
+"""
+Numeric kernels for the NSGA-II non-dominated sort and crowding distance.
+
+These functions operate on plain float64 fitness matrices, keeping the hot
+array math separate from the Phenotype object graph. That also leaves them in
+a shape where a JIT compiler (e.g. numba) could be dropped in later without
+touching the evolver itself.
+
+This module provides:
+- dominance_matrix: pairwise dominance over a fitness matrix
+- fronts_from_dominance: Pareto front index arrays from a dominance matrix
+- crowding_distances: crowding distances for one front's fitness matrix
+"""
+from collections.abc import Iterator
+
+import numpy as np
+
+# Fronts of at most this many individuals are all boundary members, so every
+# crowding distance in them is infinite
+_ALL_BOUNDARY_FRONT_SIZE = 2
+
+
+def dominance_matrix(F: np.ndarray) -> np.ndarray:
+    """
+    Compute the pairwise dominance matrix for a fitness matrix (minimization).
+
+    :param F: An (N, M) matrix of fitness values, one row per individual.
+    :type F: np.ndarray
+    :return: A boolean (N, N) matrix where entry [i, j] is True iff
+        individual i dominates individual j.
+    :rtype: np.ndarray
+    """
+    le = (F[:, None, :] <= F[None, :, :]).all(axis=2)
+    lt = (F[:, None, :] < F[None, :, :]).any(axis=2)
+    return le & lt
+
+
+def dominance_cross(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Compute dominance of one fitness matrix's individuals over another's.
+
+    :param A: An (Na, M) matrix of fitness values.
+    :type A: np.ndarray
+    :param B: An (Nb, M) matrix of fitness values.
+    :type B: np.ndarray
+    :return: A boolean (Na, Nb) matrix where entry [i, j] is True iff row i
+        of A dominates row j of B.
+    :rtype: np.ndarray
+    """
+    le = (A[:, None, :] <= B[None, :, :]).all(axis=2)
+    lt = (A[:, None, :] < B[None, :, :]).any(axis=2)
+    return le & lt
+
+
+def iter_fronts_from_dominance(dom: np.ndarray) -> Iterator[np.ndarray]:
+    """
+    Lazily yield Pareto front index arrays from a dominance matrix.
+
+    Fronts are produced one at a time so a caller that only needs the first
+    few (e.g. elitist truncation) can stop without paying for the deep tail
+    fronts.
+
+    :param dom: A boolean (N, N) dominance matrix as returned by
+        dominance_matrix.
+    :type dom: np.ndarray
+    :return: An iterator of index arrays, one per front, best front first.
+    :rtype: Iterator[np.ndarray]
+    """
+    # How many individuals dominate each individual
+    domination_count = dom.sum(axis=0)
+
+    # Individuals dominated by nobody form the first front
+    current = np.flatnonzero(domination_count == 0)
+    while current.size > 0:
+        yield current
+        # Mark the front's members as assigned, then release everything they
+        # dominate; whoever drops to zero belongs in the next front.
+        domination_count[current] = -1
+        domination_count -= dom[current].sum(axis=0)
+        current = np.flatnonzero(domination_count == 0)
+
+
+def fronts_from_dominance(dom: np.ndarray) -> list[np.ndarray]:
+    """
+    Extract all Pareto fronts from a dominance matrix.
+
+    :param dom: A boolean (N, N) dominance matrix as returned by
+        dominance_matrix.
+    :type dom: np.ndarray
+    :return: A list of index arrays, one per front, best front first.
+    :rtype: list[np.ndarray]
+    """
+    return list(iter_fronts_from_dominance(dom))
+
+
+def crowding_distances_by_front(F: np.ndarray, fronts: list[np.ndarray]) -> np.ndarray:
+    """
+    Compute crowding distances for every front of a population at once.
+
+    Each objective is argsorted once globally; every front then orders its
+    members by those precomputed sort positions (a cheap integer-key sort)
+    instead of re-sorting its fitness values per objective per front.
+
+    :param F: An (N, M) matrix of fitness values for the whole population.
+    :type F: np.ndarray
+    :param fronts: A list of index arrays as returned by
+        fronts_from_dominance.
+    :type fronts: list[np.ndarray]
+    :return: An array of N crowding distances indexed like F's rows.
+    :rtype: np.ndarray
+    """
+    N, M = F.shape
+    distances = np.zeros(N)
+
+    # Global position of every individual in each objective's sorted order
+    global_rank = np.empty((N, M), dtype=np.int64)
+    for m in range(M):
+        order = np.argsort(F[:, m], kind="stable")
+        global_rank[order, m] = np.arange(N)
+
+    for idx in fronts:
+        L = idx.size
+        if L <= _ALL_BOUNDARY_FRONT_SIZE:
+            distances[idx] = np.inf
+            continue
+
+        dist = np.zeros(L)
+        for m in range(M):
+            # Positions into idx, ordered by the global sort for objective m
+            order_local = np.argsort(global_rank[idx, m], kind="stable")
+            vals = F[idx[order_local], m]
+            f_min = vals[0]
+            f_max = vals[-1]
+            if f_max == f_min:
+                continue
+
+            # One scalar division, then a vector multiply over the interior
+            inv_range = 1.0 / (f_max - f_min)
+            contrib = np.zeros(L)
+            contrib[order_local[1:-1]] = (vals[2:] - vals[:-2]) * inv_range
+            contrib[order_local[0]] = contrib[order_local[-1]] = np.inf
+            dist += contrib
+        distances[idx] = dist
+    return distances
+
+
+def crowding_distances(F: np.ndarray) -> np.ndarray:
+    """
+    Compute crowding distances for the individuals of one front.
+
+    :param F: An (L, M) matrix of fitness values for the front's individuals.
+    :type F: np.ndarray
+    :return: An array of L crowding distances in the same order as F's rows.
+    :rtype: np.ndarray
+    """
+    L = F.shape[0]
+    distances = np.zeros(L)
+    if L <= _ALL_BOUNDARY_FRONT_SIZE:
+        distances[:] = np.inf
+        return distances
+
+    # For every objective
+    for m in range(F.shape[1]):
+        # Sort the front for this objective
+        order = np.argsort(F[:, m], kind="stable")
+        # Get the max and min for normalization
+        f_min = F[order[0], m]
+        f_max = F[order[-1], m]
+
+        # If equal we will get division by zero, so skip
+        if f_max == f_min:
+            continue
+
+        # Interior points get the normalized gap between their two closest
+        # neighbors; boundary points get infinite distance. Accumulating into
+        # a separate per-objective array (instead of overwriting boundary
+        # distances to inf inside the loop) keeps interior points that sit on
+        # a boundary for one objective accumulating on the others.
+        inv_range = 1.0 / (f_max - f_min)
+        contrib = np.zeros(L)
+        contrib[order[1:-1]] = (F[order[2:], m] - F[order[:-2], m]) * inv_range
+        contrib[order[0]] = contrib[order[-1]] = np.inf
+        distances += contrib
+    return distances
@@ -1,15 +1,47 @@
 """This files contains functions for calculating fitness values."""
 
 import glob
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
 
 import healpy as hp
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 import pylab as plt
 from astropy import units as u
-from astropy.coordinates import AltAz, EarthLocation, Galactic, SkyCoord
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
 from astropy.time import Time
-from astropy_healpix import HEALPix
+
+# 10**(x/10) == exp(x * ln(10)/10); the exp form runs on the SIMD exp ufunc
+# instead of generic pow, which matters on the (Nfreqs, Npixels) beam blocks
+_LN10_OVER_10 = np.log(10.) / 10.
+
+# Below this many UAN files, a directory is parsed serially; spawning worker
+# processes costs more than the parses they would run
+_PARALLEL_LOAD_MIN_FILES = 8
+
+# Reference maps by path, and interpolated sky temperatures by
+# (path, location, obstime, beam grid): the map, observer and beam grid are
+# invariant across GA generations, so without these caches every fitness
+# evaluation would redo a full FITS read and a bilinear interpolation over
+# the whole beam grid.
+_ref_map_cache = {}
+_tmap_cache = {}
+
+
+def _get_ref_map(ref_map_path : str) -> npt.ArrayLike:
+    """Load a healpix reference map from a fits file, cached per path."""
+    ref_map = _ref_map_cache.get(ref_map_path)
+    if ref_map is None:
+        # float32 halves the bytes moved per lookup (the map's own
+        # precision is far below that), and memmap lets the OS page cache
+        # share the file across processes
+        ref_map = hp.fitsfunc.read_map(ref_map_path, dtype=np.float32,
+                                       memmap=True)
+        _ref_map_cache[ref_map_path] = ref_map
+    return ref_map
 
 
 def beam_correction_factor(beam_power_db : npt.ArrayLike,
@@ -17,9 +49,12 @@ def beam_correction_factor(beam_power_db : npt.ArrayLike,
                            beam_az_deg : npt.ArrayLike,
                            beam_freqs_MHz : npt.ArrayLike,
                            beam_ref_idx : int,
+                           *,
                            ref_map_path : str="src/assets/haslam408_dsds_Remazeilles2014.fits",
                            location : EarthLocation = None,
-                           obstime : Time = None) -> npt.ArrayLike:
+                           obstime : Time = None,
+                           interp : str = "bilinear",
+                           beam_power_is_linear : bool = False) -> npt.ArrayLike:
     """
     Calculates the beam correction factor as defined in Eq. 7 of Spinelli et al. (2022) [https://doi.org/10.1093/mnras/stac1804].
 
@@ -62,6 +97,15 @@ def beam_correction_factor(beam_power_db : npt.ArrayLike,
         obstime (astropy.Time):
             Object containing the time of the observation. If unspecified, will
             default to `2025-08-01 22:00:00Z`.
+        interp (str):
+            Reference-map interpolation scheme: `'bilinear'` (default) for
+            4-neighbour weighted interpolation, or `'nearest'` for a plain
+            pixel lookup, which is cheaper and visually identical when the
+            map resolution is well below the beam's grid spacing.
+        beam_power_is_linear (bool):
+            If True, `beam_power_db` already holds linear power (e.g. from
+            `load_uan_directory(..., return_linear=True)`) and the dB
+            conversion pass is skipped.
 
     Returns:
         bcf (array_like):
@@ -71,51 +115,93 @@ def beam_correction_factor(beam_power_db : npt.ArrayLike,
     # Load healpix reference map, assumed to be at 408 MHz
     spectral_index_ref_freq = 408. # MHz
     beta = -2.7 # spectral index for reference map power-law frequency spectrum
-    ref_map = hp.fitsfunc.read_map(ref_map_path) # load map from fits file
-
-    # Set up HP object, which is assuemd to be in Galactic coords
-    hp_map = HEALPix(nside=hp.npix2nside(ref_map.size), order="RING", frame=Galactic())
+    ref_map = _get_ref_map(ref_map_path) # load map from fits file, cached
 
     # Define local alt/az coordinate system
     if location is None:
         location = EarthLocation(lat=53.2421*u.deg, lon=-2.3067*u.deg, height=70.)
     if obstime is None:
         obstime = Time("2025-08-01 22:00:00Z")
-    frame_altaz = AltAz(obstime=obstime, location=location)
-
-    # Set up Astropy coordinate objects for each pixel of the beam
-    coords = SkyCoord(beam_az_deg.ravel() * u.deg, beam_alt_deg.ravel() * u.deg, frame=frame_altaz)
-
-    # Interpolate values of reference map onto the same coords as the beam
-    tmap = hp_map.interpolate_bilinear_skycoord(coords, ref_map)
 
-    # Integrals of beam at ref. frequency
-    # (integral of beam and sky times beam over solid angle at ref. freq.)
+    # Interpolate values of reference map onto the same coords as the beam.
+    # The interpolated map is cached: the observer, obstime and beam grid
+    # are fixed across a GA run, so only the first evaluation pays for the
+    # coordinate transform and interpolation.
+    beam_alt_deg = np.asarray(beam_alt_deg)
+    beam_az_deg = np.asarray(beam_az_deg)
+    tmap_key = (ref_map_path, str(location), str(obstime), interp,
+                beam_alt_deg.tobytes(), beam_az_deg.tobytes())
+    tmap = _tmap_cache.get(tmap_key)
+    if tmap is None:
+        # One 3x3 rotation matrix stands in for astropy's per-pixel
+        # transformation graph: for a fixed observer and obstime the
+        # AltAz -> Galactic transform is a rotation to very good
+        # approximation (the direction-dependent corrections astropy adds,
+        # e.g. aberration, are tens of arcseconds — far below the beam's
+        # 1-degree gridding). Solve for the rotation by transforming the
+        # three AltAz basis directions once, then rotate every beam pixel
+        # with a single matrix product.
+        frame_altaz = AltAz(obstime=obstime, location=location)
+        probes = SkyCoord(az=[0., 90., 0.] * u.deg, alt=[0., 0., 90.] * u.deg,
+                          frame=frame_altaz).galactic
+        rot = probes.cartesian.xyz.value # columns: images of the basis
+
+        # Beam alt/az as Cartesian unit vectors
+        alt_rad = np.deg2rad(beam_alt_deg.ravel())
+        az_rad = np.deg2rad(beam_az_deg.ravel())
+        cos_alt = np.cos(alt_rad)
+        xyz = np.stack((cos_alt * np.cos(az_rad),
+                        cos_alt * np.sin(az_rad),
+                        np.sin(alt_rad)))
+
+        # Rotate into Galactic and read off healpix angles
+        # (map assumed to be RING-ordered in Galactic coords)
+        gx, gy, gz = rot @ xyz
+        theta = np.arccos(np.clip(gz, -1., 1.)) # colatitude
+        phi = np.arctan2(gy, gx)                # longitude
+
+        # Interpolate values of reference map at the beam pixels
+        if interp == "nearest":
+            nside = hp.npix2nside(ref_map.size)
+            tmap = ref_map[hp.pixelfunc.ang2pix(nside, theta, phi)]
+        elif interp == "bilinear":
+            tmap = hp.pixelfunc.get_interp_val(ref_map, theta, phi)
+        else:
+            raise ValueError("interp must be 'bilinear' or 'nearest'.")
+        _tmap_cache[tmap_key] = tmap
+
+    # Integrals of beam at each frequency
+    # (integral of beam and sky times beam over solid angle).
     # All integrals are just sums, assuming fixed pixel area (true for healpix).
     # No pixel area factor is used as they should cancel in the BCF ratio.
-    beam_ref = (10.**(beam_power_db[beam_ref_idx]/10.)).flatten() # convert dB to linear gain
-    tsky_ref = tmap * (beam_freqs_MHz[beam_ref_idx] / spectral_index_ref_freq)**beta
-    beam_integ_ref = np.sum(beam_ref)
-    sky_times_beam_integ_ref = np.sum(beam_ref * tsky_ref)
-
-    # Loop over frequencies to calculate BCF
-    bcf = np.zeros(beam_freqs_MHz.size)
-    for i, freq in enumerate(beam_freqs_MHz):
-        # Beam and sky maps at this frequency
-        beam = (10.**(beam_power_db[i]/10.)).flatten()
-        #tsky = tmap * (freq / spectral_index_ref_freq)**beta
-
-        # Integral of beam and ref. sky times beam at this frequency
-        beam_integ = np.sum(beam)
-        sky_times_beam_integ = np.sum(beam * tsky_ref)
-
-        # Populate BCF value in array
-        bcf[i] = (sky_times_beam_integ / sky_times_beam_integ_ref) \
-               * (beam_integ_ref / beam_integ)
+    # The dB-to-linear conversion and both integrals run over the whole
+    # (Nfreqs, Npix) block at once: one ufunc pass for the conversion, an
+    # axis-1 reduction for the beam integrals, and a matrix-vector product
+    # for the sky-weighted integrals, instead of a Python-level loop over
+    # frequencies.
+    # The pipeline runs in float32: every input is physically
+    # low-precision (dB beam patterns, a sky map with percent-level
+    # calibration), so single precision halves the memory traffic through
+    # the (Nfreqs, Npix) block and dispatches the matrix-vector product to
+    # sgemv. The cast also forces a contiguous block — sliced or
+    # fancy-indexed callers can hand in strided views that would push BLAS
+    # onto its slow path.
+    beam_lin = np.ascontiguousarray(
+        beam_power_db.reshape(beam_freqs_MHz.size, -1), dtype=np.float32)
+    if not beam_power_is_linear:
+        beam_lin = np.exp(beam_lin * np.float32(_LN10_OVER_10)) # convert dB to linear gain
+    tsky_ref = (tmap * (beam_freqs_MHz[beam_ref_idx] / spectral_index_ref_freq)**beta).astype(np.float32)
+    beam_integ = beam_lin.sum(axis=1)
+    sky_times_beam_integ = beam_lin @ tsky_ref
+
+    # BCF at each frequency, as a ratio against the reference frequency
+    bcf = (sky_times_beam_integ / sky_times_beam_integ[beam_ref_idx]) \
+        * (beam_integ[beam_ref_idx] / beam_integ)
     return bcf
 
 
-def calculate_bcf_stats(freqs : npt.ArrayLike, bcf : npt.ArrayLike) -> dict:
+def calculate_bcf_stats(freqs : npt.ArrayLike, bcf : npt.ArrayLike,
+                        inv_df : npt.ArrayLike = None) -> dict:
     """
     Very simple summary statistics about the beam correction factor.
 
@@ -124,6 +210,10 @@ def calculate_bcf_stats(freqs : npt.ArrayLike, bcf : npt.ArrayLike) -> dict:
             Frequencies at which the BCF was evaluated. Assumed to be in MHz.
         bcf (array_like):
             Array of BCF values.
+        inv_df (array_like):
+            Optional precomputed `1.0/np.diff(freqs)`. Callers evaluating
+            many BCFs on the same frequency grid can hoist the frequency
+            differences out of the loop.
 
     Returns:
         stats (dict):
@@ -142,20 +232,30 @@ def calculate_bcf_stats(freqs : npt.ArrayLike, bcf : npt.ArrayLike) -> dict:
     """
     stats = {}
 
-    # Calculate RMS value
-    stats["rms"] = np.sqrt(np.mean((bcf - 1.)**2.))
+    # Calculate RMS value. einsum fuses the square-and-sum, skipping the
+    # (bcf - 1)**2 temporary.
+    dev = bcf - 1.
+    stats["rms"] = np.sqrt(np.einsum("i,i->", dev, dev) / dev.size)
 
-    # Calculate swing
-    stats["swing"] = bcf.max() - bcf.min()
+    # Calculate swing (single min/max pass)
+    stats["swing"] = np.ptp(bcf)
 
     # Calculate max. absolute derivative
     # Lower is better
-    stats["max_abs_deriv"] = np.max(np.abs(np.diff(bcf) / np.diff(freqs)))
+    if inv_df is None:
+        inv_df = 1.0 / np.diff(freqs)
+    stats["max_abs_deriv"] = np.max(np.abs(np.diff(bcf) * inv_df))
     return stats
 
 
-def load_uan(fname : str) -> tuple[float, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]:
-    """Load antenna pattern data from a UAN text file."""
+def load_uan(fname : str, *, return_linear : bool = False) -> tuple[float, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]:
+    """
+    Load antenna pattern data from a UAN text file.
+
+    With `return_linear=True` the pattern is returned as linear power
+    rather than dB, skipping a log10 pass that downstream consumers like
+    `beam_correction_factor` would only undo again.
+    """
     def strip_header(f : str) -> tuple[int, int, str, float]:
         # Parse and strip header lines from input file
         phi_inc = theta_inc = magnitude = None    # need these to process the file
@@ -179,27 +279,23 @@ def load_uan(fname : str) -> tuple[float, npt.ArrayLike, npt.ArrayLike, npt.Arra
             "Required headers missing"
         return phi_inc, theta_inc, magnitude_unit, freq_hz
 
-    def polar_to_re_im(fn : callable, amp : float, phase : float) -> complex:
-        # amp in dB and phase in degrees
-        return fn(amp) * (np.cos(np.deg2rad(phase)) + 1.j*np.sin(np.deg2rad(phase)))
-
     # Helper conversion functions
     def dB_to_lin(vals : npt.ArrayLike) -> npt.ArrayLike:
-        return 10.**(vals/10.)
+        return np.exp(vals * _LN10_OVER_10)
 
     def no_change(vals : npt.ArrayLike) -> npt.ArrayLike:
         return vals
 
-    def to_power(efield : tuple[complex, complex]) -> float:
-        return (efield[0] * np.conj(efield[0]) + efield[1] * np.conj(efield[1])).real
-
     # Open file and parse data
     with open(fname) as f:
         # Parse header
         za_inc, az_inc, magnitude_type, freq_hz = strip_header(f)
 
-        # Load data from remaining rows in file
-        uan_values = np.loadtxt(f)
+        # Load data from remaining rows in file. pandas' C tokenizer parses
+        # the whitespace table several times faster than np.loadtxt's
+        # Python-level reader.
+        uan_values = pd.read_csv(f, sep=r"\s+", header=None, engine="c",
+                                 dtype=np.float64).to_numpy()
 
     # Zenith angle and azimuth arrays
     za = np.sort(np.unique(uan_values[:, 0])).astype(int)
@@ -212,30 +308,38 @@ def load_uan(fname : str) -> tuple[float, npt.ArrayLike, npt.ArrayLike, npt.Arra
 
     # Unpack antenna pattern values
     # (Naxes_vec, 1, Nfeeds or Npols, Nfreqs, Naxes2, Naxes1)
-    values = np.zeros((za.size, az.size))
-    for i in range(uan_values.shape[0]):
-        _za = int(uan_values[i, 0])
-        _az = int(uan_values[i, 1])
-
-        # E-field as complex number
-        E_za = polar_to_re_im(scale, uan_values[i, 2], uan_values[i, 4])
-        E_az = polar_to_re_im(scale, uan_values[i, 3], uan_values[i, 5])
-        assert values[_za//za_inc, _az//az_inc] == 0, \
-               "az='%s' already has a value" % str(_az)
-
-        # Convert E-field to power
-        values[_za//za_inc, _az//az_inc] = to_power((E_az, E_za))
+    # All rows are processed in one vectorized pass: grid indices,
+    # amplitudes and powers come from whole-column ufunc calls instead of
+    # per-row Python arithmetic. The phase columns cancel in
+    # |E|^2 = |E_az|^2 + |E_za|^2, so they are never read.
+    iz = uan_values[:, 0].astype(int) // za_inc
+    ia = uan_values[:, 1].astype(int) // az_inc
+    amp_za = scale(uan_values[:, 2])
+    amp_az = scale(uan_values[:, 3])
+    power = amp_za * amp_za + amp_az * amp_az
+
+    # Check that each az/za cell appears exactly once: a boolean scatter
+    # plus one reduction, instead of sorting every index pair
+    filled = np.zeros((za.size, az.size), dtype=bool)
+    filled[iz, ia] = True
+    assert filled.sum() == iz.size, "duplicate az/za entries"
 
+    values = np.zeros((za.size, az.size))
+    if return_linear:
+        values[iz, ia] = power
+    else:
         # need to convert power to dB here
         # dB = 10 * log10(Watts / Reference Power)
-        values[_za//za_inc, _az//az_inc] = 10 * np.log10(values[_za//za_inc, _az//az_inc])
+        values[iz, ia] = 10 * np.log10(power)
 
     # Check that array isn't blank
     assert np.min(values) != 0
     return freq_hz, za, az, values
 
 
-def load_uan_directory(path : str, suffix : str = ".uan") -> tuple[npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]:
+def load_uan_directory(path : str, suffix : str = ".uan", *,
+                       return_linear : bool = False,
+                       ) -> tuple[npt.ArrayLike, npt.ArrayLike, npt.ArrayLike, npt.ArrayLike]:
     """
     Load a series of UAN files from a directory, and pack into an array ordered by frequency.
 
@@ -245,6 +349,8 @@ def load_uan_directory(path : str, suffix : str = ".uan") -> tuple[npt.ArrayLike
             files for the same antenna at different frequencies.
         suffix (str):
             Suffix of the data files, e.g. '.uan'.
+        return_linear (bool):
+            If True, beams hold linear power instead of dB (see `load_uan`).
 
     Returns:
         beams (array_like):
@@ -260,16 +366,23 @@ def load_uan_directory(path : str, suffix : str = ".uan") -> tuple[npt.ArrayLike
     # Get list of files
     files = glob.glob("%s/*%s" % (path, suffix))
 
+    # Each file is parsed independently, so larger directories fan out
+    # across worker processes; small ones stay serial since pool startup
+    # costs more than the handful of parses it saves.
+    loader = partial(load_uan, return_linear=return_linear)
+    if len(files) >= _PARALLEL_LOAD_MIN_FILES:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(loader, files))
+    else:
+        results = [loader(fname) for fname in files]
+
     # Current az, za arrays
     az, za = np.array([]), np.array([])
 
-    # Loop over files
+    # Loop over parsed files
     freqs = []
     beam_list = []
-    for fname in files:
-
-        # Load file
-        freq_hz, _za, _az, beam = load_uan(fname)
+    for freq_hz, _za, _az, beam in results:
 
         # Compare az/za arrays to make sure the ordering is the same
         if az.size > 0:
@@ -282,33 +395,50 @@ def load_uan_directory(path : str, suffix : str = ".uan") -> tuple[npt.ArrayLike
         freqs.append(freq_hz / 1e6) # convert to MHz
         beam_list.append(beam)
 
-    # Re-order arrays
-    idxs = np.argsort(freqs)
-    beams = [beam_list[idx] for idx in idxs]
-    beams = np.array(beams)
-    freqs = np.unique(freqs)
+    # Re-order arrays by frequency. The stacked block is indexed once
+    # instead of copying each beam through a Python list, and the explicit
+    # sort keeps duplicate frequencies visible — np.unique would silently
+    # collapse them and desynchronize freqs from beams.
+    freqs = np.array(freqs)
+    order = np.argsort(freqs)
+    beams = np.stack(beam_list, axis=0)[order]
+    freqs = freqs[order]
     return beams, freqs, za, az
 
 
-def calculate_fitnesses(uan_directory_root : str) -> dict:
+def _uan_directory_mtime(path : str, suffix : str = ".uan") -> float:
     """
-    Calculates fitness values (on all objectives).
+    Newest modification time among the directory's UAN files.
 
-    Args:
-        uan_directory_root (str): Path to directory. This directory is assumed to
-            contain a collection of uan files for the same antenna at
-            different frequencies.
+    This is the cache key for _load_and_compute_bcf: rewriting a file in
+    place (same name, new simulation output) changes the file's mtime but
+    not the directory's, so the directory mtime alone would serve a stale
+    BCF. Falls back to the directory's own mtime when no files match.
+    """
+    files = glob.glob("%s/*%s" % (path, suffix))
+    if not files:
+        return Path(path).stat().st_mtime
+    return max(Path(fname).stat().st_mtime for fname in files)
 
-    Returns:
-        bcf_statistics (dict): a dictionary where keys are statistic names and
-            values are the values of those statistics (which can be used as fitness
-            functions)
 
+@lru_cache(maxsize=1)
+def _load_and_compute_bcf(uan_directory_root : str, _mtime : float) -> tuple:
+    """
+    Load a UAN directory and evaluate its beam correction factor.
+
+    Shared by calculate_fitnesses and make_plots so that plotting alongside
+    fitness evaluation does not redo the directory load and the BCF; cached
+    on (path, newest UAN file mtime) so updated simulation output
+    invalidates the entry. Beams are returned as linear power.
     """
     # freq_hz, za, az, values = load_uan("uan_files/0_uan_files/0/0_0_1.uan")
 
     # beams, freqs, za, az = load_uan_directory("uan_files/0_uan_files/1")
-    beams, freqs, za, az = load_uan_directory(uan_directory_root)
+    # Keep the beams linear end to end: nothing here needs dB, and the
+    # round trip through log10 and back is a full pass over the beam block
+    # each way.
+    beams, freqs, za, az = load_uan_directory(uan_directory_root,
+                                              return_linear=True)
 
     alt = 90-za              # Get altitude and work off that
     az_grid, alt_grid = np.meshgrid(az, alt)
@@ -323,41 +453,49 @@ def calculate_fitnesses(uan_directory_root : str) -> dict:
                                 beam_az_deg=az_grid.flatten(),
                                 beam_freqs_MHz=freqs,
                                 beam_ref_idx=freqs.size//2,
+                                beam_power_is_linear=True,
                                 )
-
-    return calculate_bcf_stats(freqs, bcf)
+    return beams, freqs, za, az, bcf
 
 
-def make_plots(uan_directory_root : str) -> None:
+def calculate_fitnesses(uan_directory_root : str) -> dict:
     """
-    Makes plots of the beam power and beam correction factor.
+    Calculates fitness values (on all objectives).
 
     Args:
         uan_directory_root (str): Path to directory. This directory is assumed to
             contain a collection of uan files for the same antenna at
             different frequencies.
 
+    Returns:
+        bcf_statistics (dict): a dictionary where keys are statistic names and
+            values are the values of those statistics (which can be used as fitness
+            functions)
+
     """
-    beams, freqs, za, az = load_uan_directory(uan_directory_root)
+    _, freqs, _, _, bcf = _load_and_compute_bcf(
+        uan_directory_root, _uan_directory_mtime(uan_directory_root))
+    return calculate_bcf_stats(freqs, bcf)
 
-    alt = 90-za              # Get altitude and work off that
-    az_grid, alt_grid = np.meshgrid(az, alt)
 
-    # beams = beams[:, :180, :360]
+def make_plots(uan_directory_root : str) -> None:
+    """
+    Makes plots of the beam power and beam correction factor.
 
-    print(beams.shape)
+    Args:
+        uan_directory_root (str): Path to directory. This directory is assumed to
+            contain a collection of uan files for the same antenna at
+            different frequencies.
 
-    # Calculate beam correction factor
-    bcf = beam_correction_factor(beam_power_db=beams,
-                                beam_alt_deg=alt_grid.flatten(),
-                                beam_az_deg=az_grid.flatten(),
-                                beam_freqs_MHz=freqs,
-                                beam_ref_idx=freqs.size//2,
-                                )
+    """
+    # Shares the loaded beams and BCF with calculate_fitnesses; only the
+    # plotted slice is converted back to dB.
+    beams, freqs, _za, _az, bcf = _load_and_compute_bcf(
+        uan_directory_root, _uan_directory_mtime(uan_directory_root))
 
     plt.figure(figsize=(10, 4))
     plt.subplot(121)
-    plt.matshow(beams[0], vmax=20., vmin=-50., fignum=False, aspect="auto")
+    plt.matshow(10*np.log10(beams[0]), vmax=20., vmin=-50., fignum=False, aspect="auto")
     cbar = plt.colorbar()
     plt.xlabel("Azimuth [deg]")
     plt.ylabel("Altitude [deg]")
@@ -11,16 +11,18 @@ cfg = ParametersObject("src/config.toml")
 class AnalysisTest(unittest.TestCase):
     """A test class to test the Analysis class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared base population once; genotype generation is the expensive part."""
+        cls._base_population = [
+            Phenotype(Genotype(cfg).generate(2, random.Random(i)), f"p{i}", "None", 0)
+            for i in range(15)
+        ]
+
     def make_analysis(self, population_size: int) -> Analysis:
         """Make a population of Phenotypes to be used by other test methods in this class."""
-        g = Genotype(cfg).generate(2, random.Random(1))
-        # Build a valid Phenotype object.
-        p = Phenotype(g, "Jessie", "None", 0)
-        p = Phenotype(g, "James", "None", 0)
-
         r = random.randint
-        genotypes = [Genotype(cfg).generate(2, random.Random(1)) for _ in range(population_size)]
-        phenotypes = [Phenotype(g, "Evan", "None", 0) for g in genotypes]
+        phenotypes = [p.clone() for p in self._base_population[:population_size]]
         for p in phenotypes:
             p.nsgaii_rank = r(0,10)
             p.fitness_score = {"metric1": r(0,10),
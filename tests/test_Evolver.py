@@ -1,10 +1,14 @@
 import random
 import unittest
 
+import numpy as np
+
 import src.Evolver as E
 
 
 class MockPhenotype:
+    __slots__ = ("id", "fitness", "nsgaii_rank", "nsgaii_distance", "fvec")
+
     def __init__(self, id, fitness):
         self.id = id
         self.fitness = fitness
@@ -20,22 +24,30 @@ class NSGA2Test(unittest.TestCase):
     A test class to test the NSGA2 evolve method.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared SoA fitness matrix once for the class."""
+        cls.fitness_matrix = np.array([
+            # Should be rank 1
+            [10, 20, 30],
+            [20, 10, 30],
+            [30, 20, 10],
+            # Should be rank 2
+            [100, 200, 300],
+            [200, 100, 300],
+            # Rank 3
+            [999, 999, 999],
+            # Added to rank 1 to ensure a non-inf crowding distance
+            [15, 15, 25],
+        ], dtype=np.float64)
+
     def setUp(self):
         """Set up NSGA2 instance for tests."""
         self.nsga2 = E.NSGA2()
         self.rand = random.Random(1)
         self.population = [
-            # Should be rank 1
-            MockPhenotype(1, fitness={"1": 10, "2": 20, "3": 30}),
-            MockPhenotype(2, fitness={"1": 20, "2": 10, "3": 30}),
-            MockPhenotype(3, fitness={"1": 30, "2": 20, "3": 10}),
-            # Should be rank 2
-            MockPhenotype(4, fitness={"1": 100, "2": 200, "3": 300}),
-            MockPhenotype(5, fitness={"1": 200, "2": 100, "3": 300}),
-            # Rank 3
-            MockPhenotype(6, fitness={"1": 999, "2": 999, "3": 999}),
-            # Added to rank 1 to ensure a non-inf crowding distance
-            MockPhenotype(7, fitness={"1": 15, "2": 15, "3": 25}),
+            MockPhenotype(i + 1, fitness=dict(zip("123", row)))
+            for i, row in enumerate(self.fitness_matrix)
         ]
 
 
@@ -84,6 +96,43 @@ class NSGA2Test(unittest.TestCase):
             if len(front) > len(front[0].fitness):
                 assert any(indiv.nsgaii_distance < float("inf") for indiv in front)
 
+    def test_crowding_distance_accumulates_over_objectives(self):
+        """Tests that interior individuals accumulate distance from every objective."""
+        front = [
+            MockPhenotype(1, fitness={"1": 0, "2": 3}),
+            MockPhenotype(2, fitness={"1": 1, "2": 2}),
+            MockPhenotype(3, fitness={"1": 2, "2": 1}),
+            MockPhenotype(4, fitness={"1": 3, "2": 0}),
+        ]
+        E.crowding_distance_assignment(front)
+
+        # Boundary individuals for either objective get inf
+        assert front[0].nsgaii_distance == float("inf")
+        assert front[-1].nsgaii_distance == float("inf")
+
+        # Interior individuals get the normalized neighbor gap from both
+        # objectives, not just the first one processed
+        self.assertAlmostEqual(front[1].nsgaii_distance, 2/3 + 2/3)
+        self.assertAlmostEqual(front[2].nsgaii_distance, 2/3 + 2/3)
+
+    def test_sort_matches_vectorized_oracle(self):
+        """Tests the sort against an independently computed dominance matrix."""
+        F = self.fitness_matrix
+        dom = (np.all(F[:, None, :] <= F[None, :, :], axis=2)
+               & np.any(F[:, None, :] < F[None, :, :], axis=2))
+
+        # Peel fronts straight off the oracle matrix
+        expected_fronts = []
+        remaining = np.ones(len(F), dtype=bool)
+        while remaining.any():
+            undominated = remaining & ~dom[remaining].any(axis=0)
+            expected_fronts.append(set(np.flatnonzero(undominated) + 1))
+            remaining &= ~undominated
+
+        fronts = E.fast_non_dominated_sort(self.population)
+        assert [{indiv.id for indiv in front} for front in fronts] \
+            == expected_fronts
+
     def test_dominates(self):
         """Tests that the indivs in the test pop correctly dominate each other."""
         # Our first indivs in our test pop should not be dominated
@@ -0,0 +1,103 @@
+import unittest
+
+import numpy as np
+
+import src.Manager as M
+from src.Manager import Manager
+from src.Parameters import ParametersObject
+from src.Population import Population
+from src.WallPair import WallPair
+
+# Record of every job the stub evaluator has seen, so tests can assert
+# cache hit/miss behavior and the payload shape.
+_evaluated_jobs = []
+
+
+def _stub_evaluate(job):
+    """Stand-in evaluate_fn: records the job and scores from its genes."""
+    genes, walls, has_ridge = job
+    _evaluated_jobs.append(job)
+    return {"metric1": genes[0], "metric2": float(len(walls))}
+
+
+class ManagerTest(unittest.TestCase):
+    """A test class to test the Manager class."""
+
+    def setUp(self):
+        """Set up a small serial-evaluation Manager for tests."""
+        self.cfg = ParametersObject("src/config.toml")
+        self.cfg.population_size = 6
+        self.cfg.parallel_evaluation = False
+        self.manager = Manager(self.cfg)
+        self.manager.initialize_population(self.cfg)
+        M._fitness_cache.clear()
+        _evaluated_jobs.clear()
+
+    def test_evaluate_population_serial(self):
+        """Tests that evaluation scores everyone and the cache absorbs repeats."""
+        self.manager._evaluate_population(_stub_evaluate)
+
+        # Every (unique) individual was evaluated exactly once
+        self.assertEqual(len(_evaluated_jobs), len(self.manager.population))
+        for phenotype in self.manager.population:
+            self.assertEqual(phenotype.fitness_score["metric1"],
+                             phenotype.genotype.height)
+
+        # Payloads carry genes, walls and the per-wall ridge flags
+        genes, walls, has_ridge = _evaluated_jobs[0]
+        self.assertEqual(len(genes), 3)
+        self.assertEqual(len(has_ridge), len(walls))
+        p = self.manager.population[0]
+        self.assertEqual(has_ridge, [wp.has_ridge for wp in p.genotype.walls])
+
+        # A second pass over the unchanged population is all cache hits
+        self.manager._evaluate_population(_stub_evaluate)
+        self.assertEqual(len(_evaluated_jobs), len(self.manager.population))
+
+    def test_evaluate_population_cache_shared(self):
+        """Tests that a functional duplicate of a scored individual is a pure cache hit."""
+        self.manager._evaluate_population(_stub_evaluate)
+        jobs_first_pass = len(_evaluated_jobs)
+
+        clone = self.manager.population[0].clone()
+        clone.indv_id = 999
+        self.manager.population.append(clone)
+
+        self.manager._evaluate_population(_stub_evaluate)
+        # No new jobs: the clone's canonical key reused its original's
+        # cache entry.
+        self.assertEqual(len(_evaluated_jobs), jobs_first_pass)
+        self.assertEqual(clone.fitness_score,
+                         self.manager.population[0].fitness_score)
+
+    def test_mutate_population_round_trip(self):
+        """Tests that batch mutation changes genes while keeping them in bounds."""
+        before = Population.from_phenotypes(self.manager.population)
+        ids_before = [p.indv_id for p in self.manager.population]
+
+        self.manager.mutate_population()
+
+        after = Population.from_phenotypes(self.manager.population)
+        # Identity and shapes are untouched; only gene values move
+        self.assertEqual([p.indv_id for p in self.manager.population], ids_before)
+        self.assertEqual(before.genes.shape, after.genes.shape)
+        self.assertEqual(before.walls.shape, after.walls.shape)
+
+        # With a 0.3 per-site rate over the whole population, at least one
+        # gene must have mutated
+        self.assertTrue(np.any(before.genes != after.genes)
+                        or np.any(before.walls != after.walls))
+
+        # Every mutated value respects its gene's bounds
+        core_lows = [self.cfg.MIN_HEIGHT, self.cfg.MIN_WAVEGUIDE_HEIGHT,
+                     self.cfg.MIN_WAVEGUIDE_LENGTH]
+        core_highs = [self.cfg.MAX_HEIGHT, self.cfg.MAX_WAVEGUIDE_HEIGHT,
+                      self.cfg.MAX_WAVEGUIDE_LENGTH]
+        self.assertTrue(np.all(after.genes >= core_lows)
+                        and np.all(after.genes <= core_highs))
+        self.assertTrue(np.all(after.walls >= WallPair.LOWS)
+                        and np.all(after.walls <= WallPair.HIGHS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,30 @@ class PhenotypeTest(unittest.TestCase):
         self.assertEqual(p.generation_created, 0)
         self.assertEqual(p.fitness_score, None)
 
+    def test_clone(self):
+        """
+        Tests that clone copies the whole individual without sharing
+        mutable state with the original.
+        """
+        g = Genotype(cfg).generate(2, random.Random(1))
+        p = Phenotype(g, 1, None, 0)
+        p.fitness_score = {"metric1": 0.5}
+
+        c = p.clone()
+
+        self.assertIsNot(c, p)
+        self.assertIsNot(c.genotype, p.genotype)
+        self.assertIsNot(c.genotype.walls[0], p.genotype.walls[0])
+        self.assertIsNot(c.fitness_score, p.fitness_score)
+        self.assertEqual(c.indv_id, p.indv_id)
+        self.assertEqual(c.genotype.height, p.genotype.height)
+        self.assertEqual(c.genotype.walls[1].angle, p.genotype.walls[1].angle)
+        self.assertEqual(c.fitness_score, p.fitness_score)
+
+        # Mutating the clone leaves the original untouched
+        c.genotype.walls[0].angle = -1.0
+        self.assertNotEqual(p.genotype.walls[0].angle, -1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
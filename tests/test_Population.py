@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from src.Genotype import Genotype
+from src.Parameters import ParametersObject
+from src.Phenotype import Phenotype
+from src.Population import CORE_GENES, WALL_GENES, Population
+
+cfg = ParametersObject("src/config.toml")
+
+
+class PopulationTest(unittest.TestCase):
+    """A test class to test the Population SoA buffer."""
+
+    def make_population(self, size: int) -> list:
+        """Make a list of Phenotypes to gather into a buffer."""
+        rand = random.Random(1)
+        return [Phenotype(Genotype(cfg).generate(2, rand), str(i), "None", 0)
+                for i in range(size)]
+
+    def test_from_phenotypes(self):
+        """Tests gathering a phenotype list into SoA arrays."""
+        population = self.make_population(5)
+        pop = Population.from_phenotypes(population)
+
+        self.assertEqual(len(pop), 5)
+        self.assertEqual(pop.genes.shape, (5, len(CORE_GENES)))
+        self.assertEqual(pop.walls.shape, (5, 2, len(WALL_GENES)))
+        self.assertEqual(pop.genes[0, 0], population[0].genotype.height)
+        self.assertEqual(pop.walls[2, 1, 0], population[2].genotype.walls[1].angle)
+
+    def test_scatter(self):
+        """Tests writing modified arrays back onto the phenotypes."""
+        population = self.make_population(3)
+        pop = Population.from_phenotypes(population)
+
+        pop.genes += 1.0
+        pop.walls[:, :, 0] = 45.0
+        pop.scatter(population)
+
+        self.assertEqual(population[1].genotype.height, pop.genes[1, 0])
+        self.assertEqual(population[2].genotype.walls[0].angle, 45.0)
+
+    def test_as_phenotype(self):
+        """Tests materializing one buffer row back into a Phenotype."""
+        population = self.make_population(4)
+        for p in population:
+            p.fitness_score = {"metric1": random.random(), "metric2": random.random()}
+        pop = Population.from_phenotypes(population)
+
+        self.assertEqual(pop.fitness.shape, (4, 2))
+        rebuilt = pop.as_phenotype(2, cfg)
+        original = population[2]
+
+        self.assertEqual(rebuilt.indv_id, original.indv_id)
+        self.assertEqual(rebuilt.parent_id, original.parent_id)
+        self.assertEqual(rebuilt.generation_created, original.generation_created)
+        self.assertEqual(rebuilt.genotype.height, original.genotype.height)
+        self.assertEqual(rebuilt.genotype.walls[1].angle, original.genotype.walls[1].angle)
+        self.assertEqual(rebuilt.fitness_score, original.fitness_score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
-from src.Selectors import NSGATournament 
+from src.Selectors import NSGATournament, SELECTORS
 
 class MockPhenotype:
     def __init__(self, rank, distance):
@@ -8,6 +7,25 @@ class MockPhenotype:
         self.nsgaii_distance = distance
 
 
+class MockRand:
+    """Scripted stand-in for random.Random: plain methods instead of
+    MagicMock's per-call __getattr__ dispatch and call recording."""
+
+    __slots__ = ("_draws", "_choice", "choice_calls")
+
+    def __init__(self, draws, choice=None):
+        self._draws = list(draws)
+        self._choice = choice
+        self.choice_calls = []
+
+    def randrange(self, n):
+        return self._draws.pop(0)
+
+    def choice(self, seq):
+        self.choice_calls.append(list(seq))
+        return self._choice
+
+
 class NSGATournamentTest(unittest.TestCase):
     """A test class to test the NSGATournament selector."""
 
@@ -20,9 +38,8 @@ class NSGATournamentTest(unittest.TestCase):
         i1 = MockPhenotype(rank=1, distance=0.5)
         i2 = MockPhenotype(rank=2, distance=1.0)
 
-        # Mock a random generator to always return the pop from sample
-        rand = MagicMock()
-        rand.sample.return_value = [i1, i2]
+        # Script the two index draws to pick i1 then i2
+        rand = MockRand([0, 0, 0, 0])
 
         result = self.selector.select_one([i1, i2], rand)
         self.assertIs(result, i1)
@@ -37,8 +54,7 @@ class NSGATournamentTest(unittest.TestCase):
         i1 = MockPhenotype(rank=1, distance=0.5)
         i2 = MockPhenotype(rank=1, distance=1.0)
 
-        rand = MagicMock()
-        rand.sample.return_value = [i1, i2]
+        rand = MockRand([0, 0])
 
         result = self.selector.select_one([i1, i2], rand)
         self.assertIs(result, i2)
@@ -48,13 +64,34 @@ class NSGATournamentTest(unittest.TestCase):
         i1 = MockPhenotype(rank=1, distance=1.0)
         i2 = MockPhenotype(rank=1, distance=1.0)
 
-        rand = MagicMock()
-        rand.sample.return_value = [i1, i2]
-        rand.choice.return_value = i2
+        rand = MockRand([0, 0], choice=i2)
 
         result = self.selector.select_one([i1, i2], rand)
         self.assertIs(result, i2)
-        rand.choice.assert_called_once_with([i1, i2])
+        self.assertEqual(rand.choice_calls, [[i1, i2]])
+
+    def test_select_index(self):
+        """Tests the array-indexed tournament against rank/distance arrays."""
+        import numpy as np
+        rank = np.array([1, 2, 1, 1], dtype=np.int32)
+        dist = np.array([0.5, 1.0, 2.0, 2.0], dtype=np.float64)
+
+        # Better rank wins
+        rand = MockRand([0, 0])
+        self.assertEqual(self.selector.select_index(rank, dist, rand), 0)
+
+        # Equal ranks: greater distance wins
+        rand = MockRand([0, 1])
+        self.assertEqual(self.selector.select_index(rank, dist, rand), 2)
+
+        # Full tie falls through to the random choice
+        rand = MockRand([2, 2], choice=3)
+        self.assertEqual(self.selector.select_index(rank, dist, rand), 3)
+        self.assertEqual(rand.choice_calls, [[2, 3]])
+
+    def test_registry(self):
+        """Tests that the selector registry resolves the tournament by name."""
+        self.assertIs(SELECTORS["NSGAII"], NSGATournament)
 
 if __name__ == '__main__':
     unittest.main()
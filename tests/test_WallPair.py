@@ -54,6 +54,25 @@ class WallPairTest(unittest.TestCase):
         self.assertEqual(wp.ridge_thickness_top, 49.54350870919409)
         self.assertEqual(wp.ridge_thickness_bottom, 44.949106478873816)
 
+    def test_generate_array(self):
+        """Tests the generate_array method for generating packed wall genes.
+        """
+        import numpy as np
+        rng = np.random.default_rng(WallPairTest.SEED)
+        walls = WallPair.generate_array(2, rng)
+
+        self.assertEqual(walls.shape, (2, len(WallPair.PARAM_NAMES)))
+        for m, name in enumerate(WallPair.PARAM_NAMES):
+            low = getattr(WallPair, "MIN_" + name.upper())
+            high = getattr(WallPair, "MAX_" + name.upper())
+            self.assertTrue(((low <= walls[:, m]) & (walls[:, m] <= high)).all())
+
+        batch = WallPair.generate_array(2, rng, size=5)
+        self.assertEqual(batch.shape, (5, 2, len(WallPair.PARAM_NAMES)))
+
+        with self.assertRaises(ValueError):
+            WallPair.generate_array(0, rng)
+
     def test_generate_list(self):
         """Tests the generate_list method for generating a list of
         randomly generated WallPair objects.
@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+
+from src import _nsga_kernels
+
+
+class NSGAKernelsTest(unittest.TestCase):
+    """A test class to test the NSGA-II numeric kernels."""
+
+    # Same fitness values as the test_Evolver population
+    FITNESS = np.array([
+        [10, 20, 30],
+        [20, 10, 30],
+        [30, 20, 10],
+        [100, 200, 300],
+        [200, 100, 300],
+        [999, 999, 999],
+        [15, 15, 25],
+    ], dtype=np.float64)
+
+    def test_dominance_matrix(self):
+        """Tests pairwise dominance over the fitness matrix."""
+        dom = _nsga_kernels.dominance_matrix(self.FITNESS)
+
+        # Nobody dominates themselves
+        assert not dom.diagonal().any()
+        # Front 1 individuals dominate the rank 2 and 3 individuals
+        for i in (0, 1, 2, 6):
+            for j in (3, 4):
+                # Index 2 trades off against index 4 so does not dominate it
+                if (i, j) != (2, 4):
+                    assert dom[i, j]
+            assert dom[i, 5]
+        # Nothing dominates the first front
+        assert not dom[:, [0, 1, 2, 6]].any()
+
+    def test_fronts_from_dominance(self):
+        """Tests extracting Pareto fronts from the dominance matrix."""
+        dom = _nsga_kernels.dominance_matrix(self.FITNESS)
+        fronts = _nsga_kernels.fronts_from_dominance(dom)
+
+        assert len(fronts) == 3
+        assert set(fronts[0]) == {0, 1, 2, 6}
+        assert set(fronts[1]) == {3, 4}
+        assert set(fronts[2]) == {5}
+
+    def test_crowding_distances(self):
+        """Tests crowding distances for the best front."""
+        front = self.FITNESS[[0, 1, 2, 6]]
+        distances = _nsga_kernels.crowding_distances(front)
+
+        # Boundary individuals get infinite distance
+        assert distances[0] == np.inf
+        assert distances[1] == np.inf
+        assert distances[2] == np.inf
+        # The interior individual gets a finite non-negative distance
+        assert 0.0 <= distances[3] < np.inf
+
+    def test_crowding_distances_by_front(self):
+        """Tests that the all-fronts computation matches the per-front one."""
+        dom = _nsga_kernels.dominance_matrix(self.FITNESS)
+        fronts = _nsga_kernels.fronts_from_dominance(dom)
+        distances = _nsga_kernels.crowding_distances_by_front(self.FITNESS, fronts)
+
+        for front in fronts:
+            expected = _nsga_kernels.crowding_distances(self.FITNESS[front])
+            assert np.array_equal(distances[front], expected)
+
+    def test_crowding_distances_small_fronts(self):
+        """Tests that fronts of one or two individuals are all infinite."""
+        for size in (1, 2):
+            distances = _nsga_kernels.crowding_distances(self.FITNESS[:size])
+            assert np.all(np.isinf(distances))
+
+
+if __name__ == '__main__':
+    unittest.main()